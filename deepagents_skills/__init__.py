@@ -10,75 +10,82 @@
 
 Example:
     >>> from deepagents_skills import SkillAgent, Config
-    >>> 
+    >>>
     >>> # 加载配置并创建智能体
     >>> config = Config.load("config.json")
     >>> agent = SkillAgent(config)
-    >>> 
+    >>>
     >>> # 列出可用技能
     >>> skills = agent.list_skills()
     >>> for skill in skills:
     ...     print(f"{skill['name']}: {skill['description']}")
-    >>> 
+    >>>
     >>> # 处理用户请求（自动匹配技能）
     >>> response = agent.process("帮我研究量子计算的最新进展")
-    >>> 
+    >>>
     >>> # 手动执行技能
     >>> result = agent.execute_skill("web-research")
-    >>> 
+    >>>
     >>> # 执行技能链
     >>> results = agent.execute_chain(["web-research", "summarize", "save-report"])
 """
 
-from deepagents_skills.config import Config
-from deepagents_skills.agent.core import SkillAgent, create_skill_agent
-from deepagents_skills.skills.model import Skill, SkillMetadata, SkillSource
-from deepagents_skills.skills.registry import SkillRegistry
-from deepagents_skills.skills.discovery import SkillDiscovery, discover_skills
-from deepagents_skills.skills.executor import SkillExecutor, ExecutionContext, ExecutionResult
-from deepagents_skills.skills.chain import SkillChain, SkillPipeline, ChainResult
-from deepagents_skills.skills.loader import load_skill, load_skill_from_directory
-from deepagents_skills.memory.store import MemoryStore, MemoryEntry
-from deepagents_skills.memory.middleware import MemoryMiddleware, create_memory_middleware
+import importlib
+from typing import Any
 
 __version__ = "0.1.0"
 
-__all__ = [
-    # 版本
-    "__version__",
-    
+# PEP 562 懒导入表：首次访问名称时才导入对应子模块，
+# 只用 Config / MemoryStore 的调用方不必承担技能系统
+# （及其可选的向量检索依赖）的导入开销
+_LAZY_IMPORTS = {
     # 配置
-    "Config",
-    
+    "Config": "deepagents_skills.config",
     # 智能体
-    "SkillAgent",
-    "create_skill_agent",
-    
+    "SkillAgent": "deepagents_skills.agent.core",
+    "create_skill_agent": "deepagents_skills.agent.core",
     # 技能模型
-    "Skill",
-    "SkillMetadata",
-    "SkillSource",
-    
+    "Skill": "deepagents_skills.skills.model",
+    "SkillMetadata": "deepagents_skills.skills.model",
+    "SkillSource": "deepagents_skills.skills.model",
     # 技能系统
-    "SkillRegistry",
-    "SkillDiscovery",
-    "discover_skills",
-    "SkillExecutor",
-    "ExecutionContext",
-    "ExecutionResult",
-    
+    "SkillRegistry": "deepagents_skills.skills.registry",
+    "SkillDiscovery": "deepagents_skills.skills.discovery",
+    "discover_skills": "deepagents_skills.skills.discovery",
+    "SkillExecutor": "deepagents_skills.skills.executor",
+    "ExecutionContext": "deepagents_skills.skills.executor",
+    "ExecutionResult": "deepagents_skills.skills.executor",
     # 技能链
-    "SkillChain",
-    "SkillPipeline",
-    "ChainResult",
-    
+    "SkillChain": "deepagents_skills.skills.chain",
+    "SkillPipeline": "deepagents_skills.skills.chain",
+    "ChainResult": "deepagents_skills.skills.chain",
     # 技能加载
-    "load_skill",
-    "load_skill_from_directory",
-    
+    "load_skill": "deepagents_skills.skills.loader",
+    "load_skill_from_directory": "deepagents_skills.skills.loader",
     # 记忆系统
-    "MemoryStore",
-    "MemoryEntry",
-    "MemoryMiddleware",
-    "create_memory_middleware",
+    "MemoryStore": "deepagents_skills.memory.store",
+    "MemoryEntry": "deepagents_skills.memory.store",
+    "MemoryMiddleware": "deepagents_skills.memory.middleware",
+    "create_memory_middleware": "deepagents_skills.memory.middleware",
+}
+
+__all__ = [
+    # 版本
+    "__version__",
+    *_LAZY_IMPORTS,
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """懒加载公共 API（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # 缓存到模块命名空间，后续访问不再走 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
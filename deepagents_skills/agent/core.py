@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Any, Callable
 
 from deepagents_skills.agent.prompt import SkillsPromptBuilder
@@ -21,6 +22,23 @@ if TYPE_CHECKING:
     from deepagents_skills.skills.model import Skill
 
 
+@dataclass(slots=True)
+class MatchedSkillSummary:
+    """匹配技能的轻量摘要（process 热路径用，避免字典分配）"""
+    name: str
+    description: str
+    priority: int
+
+
+@dataclass(slots=True)
+class ExecutedResult:
+    """技能执行结果的轻量摘要"""
+    skill: str
+    success: bool
+    output: Any = None
+    error: str | None = None
+
+
 class SkillAgent:
     """技能智能体
     
@@ -121,6 +139,18 @@ class SkillAgent:
         self._prompt_builder.set_skills(self._registry.get_all())
         return count
     
+    async def adiscover_skills(self) -> int:
+        """异步发现并加载技能
+
+        用户级和项目级目录的扫描并发执行，不阻塞事件循环。
+
+        Returns:
+            加载的技能数量
+        """
+        count = await self._registry.aload_from_discovery(self._discovery)
+        self._prompt_builder.set_skills(self._registry.get_all())
+        return count
+
     def refresh_skills(self) -> int:
         """刷新技能列表
         
@@ -129,6 +159,7 @@ class SkillAgent:
         """
         count = self._registry.refresh(self._discovery)
         self._prompt_builder.set_skills(self._registry.get_all())
+        self._tools.clear_cache()
         return count
     
     def get_skill(self, name: str) -> "Skill" | None:
@@ -161,6 +192,17 @@ class SkillAgent:
         """
         return self._executor.match(query)
     
+    def match_skills_batch(self, queries: list[str]) -> list[list["Skill"]]:
+        """批量匹配多条查询（如最近几轮用户消息）
+
+        Args:
+            queries: 查询文本列表
+
+        Returns:
+            与 queries 对应的技能列表的列表
+        """
+        return self._registry.match_batch(queries)
+
     def execute_skill(
         self,
         skill_name: str,
@@ -175,8 +217,9 @@ class SkillAgent:
         Returns:
             执行结果，技能不存在则返回 None
         """
-        skill = self._registry.get(skill_name)
-        if skill is None:
+        try:
+            skill = self._registry[skill_name]
+        except KeyError:
             return None
         return self._executor.execute(skill, context)
     
@@ -194,8 +237,9 @@ class SkillAgent:
         Returns:
             执行结果列表
         """
-        skill = self._registry.get(skill_name)
-        if skill is None:
+        try:
+            skill = self._registry[skill_name]
+        except KeyError:
             return []
         return self._executor.execute_with_dependencies(skill, context)
     
@@ -203,39 +247,168 @@ class SkillAgent:
         self,
         skill_names: list[str],
         context: ExecutionContext | None = None,
+        parallel: bool = False,
     ) -> dict[str, Any]:
         """执行技能链
-        
+
         Args:
             skill_names: 技能名称列表
             context: 执行上下文
-            
+            parallel: 是否并行执行。仅当所有技能都存在且无依赖声明时
+                生效（用线程池并发执行，总耗时趋近最慢步骤）；
+                否则回退到串行链
+
         Returns:
             执行结果
         """
+        if parallel:
+            skills = [self._registry.get(name) for name in skill_names]
+            # 空链走串行路径：线程池不允许 0 个 worker
+            if skills and all(s is not None and not s.dependencies for s in skills):
+                return self._execute_chain_parallel(skills, context)
+
         return self._tools.execute_skill_chain(skill_names, context.query if context else "")
+
+    def _execute_chain_parallel(
+        self,
+        skills: list["Skill"],
+        context: ExecutionContext | None,
+    ) -> dict[str, Any]:
+        """用线程池并发执行相互独立的技能"""
+        import concurrent.futures
+
+        if context is None:
+            context = ExecutionContext()
+
+        results: list[ExecutionResult | None] = [None] * len(skills)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(skills), 8)
+        ) as pool:
+            futures = {
+                pool.submit(self._executor.execute, skill, context): i
+                for i, skill in enumerate(skills)
+            }
+            for future in concurrent.futures.as_completed(futures):
+                results[futures[future]] = future.result()
+
+        success = all(r.success for r in results)
+        return {
+            "success": success,
+            "steps": [
+                {
+                    "skill": r.skill.name,
+                    "success": r.success,
+                    "output": r.output,
+                    "error": r.error,
+                }
+                for r in results
+            ],
+            "skipped": [],
+            "final_output": results[-1].output if results else None,
+        }
     
+    async def aexecute_chain(
+        self,
+        skill_names: list[str],
+        context: ExecutionContext | None = None,
+    ) -> dict[str, Any]:
+        """异步执行技能链
+
+        链本身保持串行语义，但在线程中运行，不阻塞事件循环。
+
+        Args:
+            skill_names: 技能名称列表
+            context: 执行上下文
+
+        Returns:
+            执行结果
+        """
+        return await asyncio.to_thread(self.execute_chain, skill_names, context)
+
     def process(
         self,
         query: str,
         auto_execute: bool = False,
         max_skills: int = 1,
+        as_dict: bool = True,
+        summary: bool = True,
     ) -> dict[str, Any]:
         """处理用户请求
-        
+
         匹配并可选地执行相关技能。
-        
+
         Args:
             query: 用户查询文本
             auto_execute: 是否自动执行匹配的技能
             max_skills: 最多执行的技能数量
-            
+            as_dict: 摘要是否转换为字典。False 时 matched_skills /
+                execution_results 为 slots 数据类实例，省去字典分配
+            summary: 是否构建完整的匹配摘要。只关心匹配了哪些技能的
+                调用方可传 False，matched_skills 退化为名称列表，
+                跳过每个技能的摘要构建
+
         Returns:
             处理结果，包含匹配的技能和执行结果
         """
         # 匹配技能
         matched_skills = self.match_skills(query)
-        
+
+        if summary:
+            matched: list[Any] = [
+                MatchedSkillSummary(skill.name, skill.description, skill.priority)
+                for skill in matched_skills
+            ]
+        else:
+            matched = [skill.name for skill in matched_skills]
+        executed = False
+        execution: list[ExecutedResult] = []
+
+        # 自动执行
+        if auto_execute and matched_skills:
+            context = ExecutionContext(query=query)
+            execution_results = self._executor.auto_execute(query, context, max_skills)
+
+            executed = True
+            execution = [
+                ExecutedResult(r.skill.name, r.success, r.output, r.error)
+                for r in execution_results
+            ]
+
+        if as_dict:
+            return {
+                "query": query,
+                "matched_skills": [asdict(m) for m in matched] if summary else matched,
+                "executed": executed,
+                "execution_results": [asdict(r) for r in execution],
+            }
+        return {
+            "query": query,
+            "matched_skills": matched,
+            "executed": executed,
+            "execution_results": execution,
+        }
+    
+    async def aprocess(
+        self,
+        query: str,
+        auto_execute: bool = False,
+        max_skills: int = 1,
+    ) -> dict[str, Any]:
+        """异步处理用户请求
+
+        匹配逻辑与 process 一致；auto_execute 时各匹配技能
+        （及其依赖）在线程中并发执行，总耗时趋近最慢技能的耗时。
+
+        Args:
+            query: 用户查询文本
+            auto_execute: 是否自动执行匹配的技能
+            max_skills: 最多执行的技能数量
+
+        Returns:
+            处理结果，包含匹配的技能和执行结果
+        """
+        matched_skills = self.match_skills(query)
+
         result = {
             "query": query,
             "matched_skills": [
@@ -249,12 +422,14 @@ class SkillAgent:
             "executed": False,
             "execution_results": [],
         }
-        
-        # 自动执行
+
         if auto_execute and matched_skills:
             context = ExecutionContext(query=query)
-            execution_results = self._executor.auto_execute(query, context, max_skills)
-            
+            grouped_results = await asyncio.gather(*[
+                asyncio.to_thread(self._executor.execute_with_dependencies, skill, context)
+                for skill in matched_skills[:max_skills]
+            ])
+
             result["executed"] = True
             result["execution_results"] = [
                 {
@@ -263,17 +438,18 @@ class SkillAgent:
                     "output": r.output,
                     "error": r.error,
                 }
-                for r in execution_results
+                for skill_results in grouped_results
+                for r in skill_results
             ]
-        
+
         return result
-    
+
     def get_skill_instructions(self, skill_name: str) -> str | None:
         """获取技能指令
-        
+
         Args:
             skill_name: 技能名称
-            
+
         Returns:
             技能指令文本
         """
@@ -5,8 +5,12 @@
 
 from __future__ import annotations
 
+import io
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+from deepagents_skills.skills.model import SkillSource
+
 if TYPE_CHECKING:
     from deepagents_skills.skills.model import Skill
 
@@ -78,6 +82,24 @@ SKILLS_SYSTEM_PROMPT = """
 记住: 技能是让你更有能力和一致性的工具。有疑问时，检查是否存在适合任务的技能！
 """
 
+# 模板在导入时按占位符预切分，构建提示词时只做字符串拼接，
+# 避免每次调用都让 str.format 重新扫描整个模板
+_PROMPT_HEAD, _rest = SKILLS_SYSTEM_PROMPT.split("{user_skills_dir}", 1)
+_PROMPT_MID1, _rest = _rest.split("{project_skills_dir}", 1)
+_PROMPT_MID2, _PROMPT_TAIL = _rest.split("{skills_list}", 1)
+del _rest
+
+# 静态模板段的 UTF-8 字节形式，导入时编码一次；
+# build_bytes 只需编码可变段再做一次 b"".join
+_PROMPT_HEAD_B = _PROMPT_HEAD.encode("utf-8")
+_PROMPT_MID1_B = _PROMPT_MID1.encode("utf-8")
+_PROMPT_MID2_B = _PROMPT_MID2.encode("utf-8")
+_PROMPT_TAIL_B = _PROMPT_TAIL.encode("utf-8")
+_BASE_PROMPT_B = BASE_SYSTEM_PROMPT.encode("utf-8")
+
+# 每个构建器缓存的完整提示词份数（按 base_prompt 区分）
+_BUILD_CACHE_SIZE = 8
+
 
 def format_skill_item(skill: "Skill") -> str:
     """格式化单个技能项
@@ -108,25 +130,29 @@ def format_skills_list(skills: list["Skill"]) -> str:
     """
     if not skills:
         return "(暂无可用技能。你可以在技能目录中创建新技能。)"
-    
-    # 按来源分组
-    user_skills = [s for s in skills if s.source.value == "user"]
-    project_skills = [s for s in skills if s.source.value == "project"]
-    
-    lines = []
-    
+
+    # 单次遍历按来源分组（按枚举成员身份比较，避免逐项字符串比较）
+    user_skills: list["Skill"] = []
+    project_skills: list["Skill"] = []
+    for s in skills:
+        (project_skills if s.source is SkillSource.PROJECT else user_skills).append(s)
+
+    # 单个 StringIO 流式写入；每段技能用一次 map + join 批量
+    # 格式化，循环体里没有逐项的 Python 分支和 write 调用
+    buf = io.StringIO()
+
     if user_skills:
-        lines.append("### 用户级技能\n")
-        for skill in user_skills:
-            lines.append(format_skill_item(skill))
-        lines.append("")
-    
+        buf.write("### 用户级技能\n\n")
+        buf.write("\n".join(map(format_skill_item, user_skills)))
+        buf.write("\n")
+        if project_skills:
+            buf.write("\n")
+
     if project_skills:
-        lines.append("### 项目级技能\n")
-        for skill in project_skills:
-            lines.append(format_skill_item(skill))
-    
-    return "\n".join(lines)
+        buf.write("### 项目级技能\n\n")
+        buf.write("\n".join(map(format_skill_item, project_skills)))
+
+    return buf.getvalue()
 
 
 class SkillsPromptBuilder:
@@ -154,49 +180,112 @@ class SkillsPromptBuilder:
         """
         self._user_skills_dir = user_skills_dir
         self._project_skills_dir = project_skills_dir
+        self._user_skills_dir_b = user_skills_dir.encode("utf-8")
+        self._project_skills_dir_b = project_skills_dir.encode("utf-8")
         self._skills = skills or []
-    
+        # 技能列表只在 discover/refresh 时变化，格式化结果可跨轮复用
+        self._cached_skills_prompt: str | None = None
+        self._cached_skills_prompt_b: bytes | None = None
+        # 完整提示词按 base_prompt 缓存（LRU），同一轮会话里
+        # 反复 build 相同基础提示词时零拼接成本
+        self._build_cache: OrderedDict[str | None, str] = OrderedDict()
+
     def set_skills(self, skills: list["Skill"]) -> None:
         """设置技能列表
-        
+
         Args:
             skills: 技能列表
         """
         self._skills = skills
-    
+        self._cached_skills_prompt = None
+        self._cached_skills_prompt_b = None
+        self._build_cache.clear()
+
     def build_skills_prompt(self) -> str:
         """构建技能系统提示词
-        
+
+        结果会被缓存，直到 set_skills 更新技能列表。
+
         Returns:
             格式化的技能系统提示词
         """
+        if self._cached_skills_prompt is not None:
+            return self._cached_skills_prompt
+
         skills_list = format_skills_list(self._skills)
-        
-        return SKILLS_SYSTEM_PROMPT.format(
-            user_skills_dir=self._user_skills_dir,
-            project_skills_dir=self._project_skills_dir,
-            skills_list=skills_list,
-        )
+
+        self._cached_skills_prompt = "".join((
+            _PROMPT_HEAD,
+            self._user_skills_dir,
+            _PROMPT_MID1,
+            self._project_skills_dir,
+            _PROMPT_MID2,
+            skills_list,
+            _PROMPT_TAIL,
+        ))
+        return self._cached_skills_prompt
     
+    def build_skills_prompt_bytes(self) -> bytes:
+        """构建技能系统提示词的 UTF-8 字节形式
+
+        静态模板段使用导入时编码好的字节常量，每次调用只编码
+        可变的技能列表段；结果同样按技能列表缓存。
+
+        Returns:
+            UTF-8 编码的技能系统提示词
+        """
+        if self._cached_skills_prompt_b is not None:
+            return self._cached_skills_prompt_b
+
+        self._cached_skills_prompt_b = b"".join((
+            _PROMPT_HEAD_B,
+            self._user_skills_dir_b,
+            _PROMPT_MID1_B,
+            self._project_skills_dir_b,
+            _PROMPT_MID2_B,
+            format_skills_list(self._skills).encode("utf-8"),
+            _PROMPT_TAIL_B,
+        ))
+        return self._cached_skills_prompt_b
+
+    def build_bytes(self, base_prompt: str | None = None) -> bytes:
+        """构建完整系统提示词的 UTF-8 字节形式
+
+        供需要直接发送字节载荷的调用方使用，免去对多 KB
+        提示词的整体重编码。
+
+        Args:
+            base_prompt: 基础提示词（可选）
+
+        Returns:
+            UTF-8 编码的完整系统提示词
+        """
+        base = base_prompt.encode("utf-8") if base_prompt else _BASE_PROMPT_B
+        return b"".join((base, b"\n\n", self.build_skills_prompt_bytes()))
+
     def build(self, base_prompt: str | None = None) -> str:
         """构建完整的系统提示词
-        
+
+        结果按 base_prompt 缓存，set_skills 更新技能列表时失效。
+
         Args:
             base_prompt: 基础提示词（可选）
-            
+
         Returns:
             完整的系统提示词
         """
-        parts = []
-        
-        # 添加基础提示词
-        if base_prompt:
-            parts.append(base_prompt)
-        else:
-            parts.append(BASE_SYSTEM_PROMPT)
-        
-        # 添加技能系统提示词
-        parts.append(self.build_skills_prompt())
-        
-        return "\n\n".join(parts)
+        cached = self._build_cache.get(base_prompt)
+        if cached is not None:
+            self._build_cache.move_to_end(base_prompt)
+            return cached
+
+        prompt = "\n\n".join((
+            base_prompt if base_prompt else BASE_SYSTEM_PROMPT,
+            self.build_skills_prompt(),
+        ))
+
+        self._build_cache[base_prompt] = prompt
+        if len(self._build_cache) > _BUILD_CACHE_SIZE:
+            self._build_cache.popitem(last=False)
+        return prompt
 
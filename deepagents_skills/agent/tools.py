@@ -31,20 +31,43 @@ def create_skill_tools(registry: "SkillRegistry", executor: "SkillExecutor") ->
         """
         return executor.list_available_skills()
     
+    # 会话级读取缓存：skill_name -> (mtime, 结果)
+    # 长会话中模型会反复读取同一技能，命中时省去文件/目录访问
+    _read_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+    _instructions_cache: dict[str, tuple[float, str]] = {}
+
+    def _skill_mtime(skill: Any) -> float:
+        """获取技能文件的修改时间（失败时返回 -1 视为不可缓存）"""
+        try:
+            return skill.path.stat().st_mtime
+        except OSError:
+            return -1.0
+
     def read_skill(skill_name: str) -> dict[str, Any]:
         """读取技能的完整内容
-        
+
+        结果按文件修改时间缓存，重复读取退化为字典查找。
+
         Args:
             skill_name: 技能名称
-            
+
         Returns:
             包含技能详细信息的字典，或错误信息
         """
         skill = registry.get(skill_name)
         if skill is None:
             return {"error": f"技能 '{skill_name}' 不存在"}
-        
-        return {
+
+        mtime = _skill_mtime(skill)
+        cached = _read_cache.get(skill_name)
+        if cached is not None and cached[0] == mtime:
+            # 返回浅拷贝，调用方改动返回值不会污染缓存；
+            # supporting_files 在缓存里存为元组，每次返回转新列表
+            result = dict(cached[1])
+            result["supporting_files"] = list(result["supporting_files"])
+            return result
+
+        result = {
             "name": skill.name,
             "description": skill.description,
             "instructions": skill.instructions,
@@ -53,8 +76,13 @@ def create_skill_tools(registry: "SkillRegistry", executor: "SkillExecutor") ->
             "source": skill.source.value,
             "path": str(skill.path),
             "directory": str(skill.directory),
-            "supporting_files": [str(f) for f in skill.list_supporting_files()],
+            "supporting_files": tuple(str(f) for f in skill.list_supporting_files()),
         }
+        if mtime >= 0:
+            _read_cache[skill_name] = (mtime, result)
+            result = dict(result)
+        result["supporting_files"] = list(result["supporting_files"])
+        return result
     
     def match_skills(query: str) -> list[dict[str, Any]]:
         """根据查询匹配合适的技能
@@ -79,17 +107,33 @@ def create_skill_tools(registry: "SkillRegistry", executor: "SkillExecutor") ->
     
     def get_skill_instructions(skill_name: str) -> str:
         """获取技能的指令文本
-        
+
+        结果按文件修改时间缓存。
+
         Args:
             skill_name: 技能名称
-            
+
         Returns:
             技能指令文本，或错误信息
         """
-        instructions = executor.get_skill_instructions(skill_name)
-        if instructions is None:
+        skill = registry.get(skill_name)
+        if skill is None:
             return f"错误: 技能 '{skill_name}' 不存在"
+
+        mtime = _skill_mtime(skill)
+        cached = _instructions_cache.get(skill_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        instructions = skill.instructions
+        if mtime >= 0:
+            _instructions_cache[skill_name] = (mtime, instructions)
         return instructions
+
+    def clear_cache() -> None:
+        """清空读取缓存（技能刷新后调用）"""
+        _read_cache.clear()
+        _instructions_cache.clear()
     
     def execute_skill_chain(skill_names: list[str], query: str = "") -> dict[str, Any]:
         """执行技能链
@@ -129,6 +173,7 @@ def create_skill_tools(registry: "SkillRegistry", executor: "SkillExecutor") ->
         "match_skills": match_skills,
         "get_skill_instructions": get_skill_instructions,
         "execute_skill_chain": execute_skill_chain,
+        "clear_cache": clear_cache,
     }
 
 
@@ -173,6 +218,10 @@ class SkillTools:
     def execute_skill_chain(self, skill_names: list[str], query: str = "") -> dict[str, Any]:
         """执行技能链"""
         return self._tools["execute_skill_chain"](skill_names, query)
+
+    def clear_cache(self) -> None:
+        """清空读取缓存"""
+        self._tools["clear_cache"]()
     
     def get_tools_dict(self) -> dict[str, callable]:
         """获取工具函数字典"""
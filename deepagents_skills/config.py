@@ -11,10 +11,23 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # 回退到标准库 json
+
 
 def _expand_path(path: str) -> Path:
-    """展开路径中的 ~ 和环境变量"""
-    return Path(os.path.expandvars(os.path.expanduser(path)))
+    """展开路径中的 ~ 和环境变量
+
+    先做子串检查再调用展开函数：绝大多数路径不含 `$` 和 `~`，
+    可以跳过两次完整的字符串扫描。
+    """
+    if "$" in path:
+        path = os.path.expandvars(path)
+    if path.startswith("~"):
+        path = os.path.expanduser(path)
+    return Path(path)
 
 
 @dataclass
@@ -143,8 +156,11 @@ class Config:
             # 配置文件不存在，使用默认配置
             return cls.default()
         
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         
         return cls(
             skills=SkillsConfig.from_dict(data.get("skills", {})),
@@ -218,8 +234,11 @@ class Config:
         }
         
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
     
     def ensure_dirs(self) -> None:
         """确保所有配置的目录存在"""
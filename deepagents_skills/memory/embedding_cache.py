@@ -0,0 +1,111 @@
+"""技能向量缓存
+
+把技能描述的向量持久化到 sqlite，按内容哈希做增量同步：
+启动时只对新增或描述变更的技能重新编码，其余直接复用缓存向量。
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+try:
+    from blake3 import blake3 as _hasher  # type: ignore
+except ImportError:
+    # blake3 不可用时退回 hashlib 的 blake2b（同为快速加密哈希）
+    from hashlib import blake2b as _hasher
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS skill_embeddings (
+    skill_name TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    dtype TEXT NOT NULL DEFAULT 'float32',
+    vector BLOB NOT NULL
+)
+"""
+
+# 旧库没有 dtype 列时的就地迁移
+_MIGRATE_DTYPE = "ALTER TABLE skill_embeddings ADD COLUMN dtype TEXT NOT NULL DEFAULT 'float32'"
+
+
+def hash_text(text: str) -> str:
+    """计算文本的内容哈希"""
+    return _hasher(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """sqlite 向量缓存
+
+    以 (skill_name, content_hash, model, vector) 为行存储技能向量。
+    content_hash 是描述文本的哈希，描述变更时对应行视为失效。
+
+    Example:
+        >>> cache = EmbeddingCache(config.memory.user_dir / "skill_embeddings.db")
+        >>> rows = cache.get_many(["web-research", "summarize"])
+        >>> cache.put_many([("web-research", h, "all-MiniLM-L6-v2", "float32", blob)])
+    """
+
+    def __init__(self, db_path: Path):
+        """初始化缓存
+
+        Args:
+            db_path: sqlite 数据库文件路径
+        """
+        self.db_path = Path(db_path)
+        self._conn: sqlite3.Connection | None = None
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """懒打开数据库连接并建表"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute(_SCHEMA)
+            try:
+                self._conn.execute(_MIGRATE_DTYPE)
+            except sqlite3.OperationalError:
+                pass  # 列已存在
+            self._conn.commit()
+        return self._conn
+
+    def get_many(self, names: list[str]) -> dict[str, tuple[str, str, str, bytes]]:
+        """批量读取缓存行
+
+        Args:
+            names: 技能名称列表
+
+        Returns:
+            name -> (content_hash, model, dtype, vector_blob) 字典
+        """
+        if not names:
+            return {}
+        conn = self._get_conn()
+        placeholders = ",".join("?" * len(names))
+        rows = conn.execute(
+            f"SELECT skill_name, content_hash, model, dtype, vector "
+            f"FROM skill_embeddings WHERE skill_name IN ({placeholders})",
+            names,
+        ).fetchall()
+        return {name: (h, model, dtype, blob) for name, h, model, dtype, blob in rows}
+
+    def put_many(self, rows: list[tuple[str, str, str, str, bytes]]) -> None:
+        """批量写入/更新缓存行
+
+        Args:
+            rows: (skill_name, content_hash, model, dtype, vector_blob) 元组列表
+        """
+        if not rows:
+            return
+        conn = self._get_conn()
+        conn.executemany(
+            "INSERT OR REPLACE INTO skill_embeddings "
+            "(skill_name, content_hash, model, dtype, vector) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -5,6 +5,9 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -60,6 +63,23 @@ MEMORY_SYSTEM_PROMPT = """
 - 保存: `write_file('{project_memory_dir}/[filename].md', content)`
 """
 
+# 导入时按两个记忆内容占位符预切分模板，构建时用 join 拼接，
+# 避免每次调用都重新解析整个模板的 format 语法
+_PROMPT_HEAD, _rest = MEMORY_SYSTEM_PROMPT.split("{user_memory}")
+_PROMPT_MID, _PROMPT_TAIL = _rest.split("{project_memory}")
+del _rest
+
+# get_memory_context 的并发读线程池（懒创建，模块级共享）
+_io_pool: ThreadPoolExecutor | None = None
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    """获取记忆读取用的共享线程池"""
+    global _io_pool
+    if _io_pool is None:
+        _io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="memory-io")
+    return _io_pool
+
 
 class MemoryMiddleware:
     """记忆中间件
@@ -92,6 +112,31 @@ class MemoryMiddleware:
         
         self._user_memory_dir = str(config.memory.user_dir)
         self._project_memory_dir = str(config.memory.project_dir)
+
+        # 记忆文件路径（agent_name 固定，路径可在此一次性拼好）
+        self._user_memory_file = str(config.memory.user_dir / f"{agent_name}.md")
+        self._project_memory_file = str(config.memory.project_dir / f"{agent_name}.md")
+
+        # 目录路径在初始化后不变，提前烘焙进模板片段，
+        # 每次构建只剩两个记忆内容槽位需要填充。
+        # 用 str.replace 而非 format：路径中即使含有花括号
+        # 也不会触发格式语法解析
+        def _bake(fragment: str) -> str:
+            return fragment.replace(
+                "{user_memory_dir}", self._user_memory_dir
+            ).replace("{project_memory_dir}", self._project_memory_dir)
+
+        self._prompt_head = _bake(_PROMPT_HEAD)
+        self._prompt_mid = _PROMPT_MID
+        self._prompt_tail = _bake(_PROMPT_TAIL)
+        # build_memory_prompt 的缓存：(两个记忆文件的 mtime_ns, 成品提示词)。
+        # mtime 未变化时跳过文件读取和模板格式化
+        self._prompt_cache: tuple[tuple[int, int], str] | None = None
+
+        # inject_memory 的记忆内容哈希缓存：记忆在相邻轮次间很少变化，
+        # 哈希一致时直接返回上次拼接好的完整提示词
+        self._last_inject_hash: str | None = None
+        self._last_injected: str | None = None
     
     def load_user_memory(self) -> str:
         """加载用户级记忆
@@ -111,33 +156,63 @@ class MemoryMiddleware:
         content = self.memory_store.load_project(self.agent_name)
         return content or "(无项目记忆)"
     
+    @staticmethod
+    def _memory_mtime(path: str) -> int:
+        """获取记忆文件的 mtime_ns，不存在时返回 0"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
     def build_memory_prompt(self) -> str:
         """构建记忆提示词
-        
+
+        结果按两个记忆文件的 mtime 缓存：记忆未变化时直接返回
+        上次格式化好的提示词，只付出两次 stat 的成本。
+
         Returns:
             格式化的记忆系统提示词
         """
-        user_memory = self.load_user_memory()
-        project_memory = self.load_project_memory()
-        
-        return MEMORY_SYSTEM_PROMPT.format(
-            user_memory_dir=self._user_memory_dir,
-            project_memory_dir=self._project_memory_dir,
-            user_memory=user_memory,
-            project_memory=project_memory,
+        mtimes = (
+            self._memory_mtime(self._user_memory_file),
+            self._memory_mtime(self._project_memory_file),
         )
+        if self._prompt_cache is not None and self._prompt_cache[0] == mtimes:
+            return self._prompt_cache[1]
+
+        prompt = "".join((
+            self._prompt_head,
+            self.load_user_memory(),
+            self._prompt_mid,
+            self.load_project_memory(),
+            self._prompt_tail,
+        ))
+        self._prompt_cache = (mtimes, prompt)
+        return prompt
     
     def inject_memory(self, base_prompt: str) -> str:
         """将记忆注入到基础提示词
-        
+
+        基础提示词和记忆内容都未变化时直接返回缓存的完整提示词。
+
         Args:
             base_prompt: 基础系统提示词
-            
+
         Returns:
             增强后的系统提示词
         """
         memory_prompt = self.build_memory_prompt()
-        return f"{memory_prompt}\n\n{base_prompt}"
+
+        digest = blake2b(
+            f"{base_prompt}\x00{memory_prompt}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        if digest == self._last_inject_hash and self._last_injected is not None:
+            return self._last_injected
+
+        injected = f"{memory_prompt}\n\n{base_prompt}"
+        self._last_inject_hash = digest
+        self._last_injected = injected
+        return injected
     
     def save_memory(self, content: str, project: bool = False) -> None:
         """保存记忆
@@ -147,29 +222,44 @@ class MemoryMiddleware:
             project: 是否保存为项目级记忆
         """
         self.memory_store.save_agent_memory(content, self.agent_name, project)
-    
+        self._last_inject_hash = None
+
     def append_memory(self, content: str, project: bool = False) -> None:
         """追加记忆
-        
+
         Args:
             content: 要追加的内容
             project: 是否追加到项目级记忆
         """
         self.memory_store.append_to_memory(self.agent_name, content, project)
+        self._last_inject_hash = None
     
     def get_memory_context(self) -> dict[str, Any]:
         """获取记忆上下文
-        
+
+        四次互相独立的磁盘读取提交到共享线程池并发执行，
+        冷缓存时耗时接近其中最慢的一次而不是四次之和。
+
         Returns:
             包含记忆信息的上下文字典
         """
+        pool = _get_io_pool()
+        f_user = pool.submit(self.memory_store.load_many, [self.agent_name])
+        f_project = pool.submit(self.memory_store.load_many, [self.agent_name], True)
+        f_list_user = pool.submit(self.memory_store.list_user)
+        f_list_project = pool.submit(self.memory_store.list_project)
+
+        user_memories = f_user.result()
+        project_memories = f_project.result()
+
         return {
-            "user_memory": self.load_user_memory(),
-            "project_memory": self.load_project_memory(),
+            # or 而非 get 的默认值：存在但为空的记忆文件同样给占位符
+            "user_memory": user_memories.get(self.agent_name) or "(无用户记忆)",
+            "project_memory": project_memories.get(self.agent_name) or "(无项目记忆)",
             "user_memory_dir": self._user_memory_dir,
             "project_memory_dir": self._project_memory_dir,
-            "all_user_memories": self.memory_store.list_user(),
-            "all_project_memories": self.memory_store.list_project(),
+            "all_user_memories": f_list_user.result(),
+            "all_project_memories": f_list_project.result(),
         }
 
 
@@ -5,44 +5,78 @@
 
 from __future__ import annotations
 
-import json
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterator
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 if TYPE_CHECKING:
     from deepagents_skills.config import Config
 
+# 读缓存的最大条目数
+READ_CACHE_SIZE = 128
 
-@dataclass
+# ASCII 小写化映射表：bytes.translate 在 C 层做单次表查找，
+# 比 Unicode 大小写折叠快数倍，用于 ASCII 查询的搜索热路径
+_ASCII_LOWER = bytes.maketrans(
+    bytes(range(0x41, 0x5B)),  # A-Z
+    bytes(range(0x61, 0x7B)),  # a-z
+)
+
+
+@dataclass(slots=True)
 class MemoryEntry:
     """记忆条目
-    
+
+    时间戳内部以纳秒级 epoch 整数存储，序列化时无需
+    isoformat/fromisoformat 的解析开销；datetime 视图通过
+    created_at/updated_at 属性按需构造。
+
     Attributes:
         key: 记忆键
         content: 记忆内容
         metadata: 元数据
-        created_at: 创建时间
-        updated_at: 更新时间
+        created_at_ns: 创建时间（epoch 纳秒）
+        updated_at_ns: 更新时间（epoch 纳秒）
     """
     key: str
     content: str
     metadata: dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
-    
+    created_at_ns: int = field(default_factory=time.time_ns)
+    updated_at_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def created_at(self) -> datetime:
+        """创建时间的 datetime 视图"""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
+
+    @property
+    def updated_at(self) -> datetime:
+        """更新时间的 datetime 视图"""
+        return datetime.fromtimestamp(self.updated_at_ns / 1e9)
+
     def to_dict(self) -> dict[str, Any]:
         """转换为字典"""
         return {
             "key": self.key,
             "content": self.content,
             "metadata": self.metadata,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at_ns,
+            "updated_at": self.updated_at_ns,
         }
-    
+
+    @staticmethod
+    def _parse_timestamp(value: Any) -> int:
+        """解析时间戳字段，兼容旧的 isoformat 字符串格式"""
+        if value is None:
+            return time.time_ns()
+        if isinstance(value, str):
+            return int(datetime.fromisoformat(value).timestamp() * 1e9)
+        return int(value)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "MemoryEntry":
         """从字典创建"""
@@ -50,8 +84,8 @@ class MemoryEntry:
             key=data["key"],
             content=data["content"],
             metadata=data.get("metadata", {}),
-            created_at=datetime.fromisoformat(data["created_at"]) if "created_at" in data else datetime.now(),
-            updated_at=datetime.fromisoformat(data["updated_at"]) if "updated_at" in data else datetime.now(),
+            created_at_ns=cls._parse_timestamp(data.get("created_at")),
+            updated_at_ns=cls._parse_timestamp(data.get("updated_at")),
         )
 
 
@@ -83,14 +117,83 @@ class MemoryStore:
         self.config = config
         self._user_dir = config.memory.user_dir
         self._project_dir = config.memory.project_dir
-    
+        # 读缓存：路径 -> (mtime_ns, size, 内容)，按 mtime+size 校验有效性。
+        # 提示词构建每轮都会重读同一批记忆文件，命中时只剩一次 stat。
+        self._read_cache: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        # 目录是否已确认存在：稳定状态下跳过每次写入前的 mkdir 系统调用
+        self._user_dir_ready = False
+        self._project_dir_ready = False
+        # Path 对象缓存：同一个 key（通常是 agent 名）每轮都会被
+        # 反复解析，缓存后免去重复的路径拼接和 Path 分配
+        self._path_cache: dict[tuple[str, str], Path] = {}
+
+    def _ensure_user_dir(self) -> None:
+        """确保用户级记忆目录存在（结果缓存，只做一次 mkdir）"""
+        if not self._user_dir_ready:
+            self._user_dir.mkdir(parents=True, exist_ok=True)
+            self._user_dir_ready = True
+
+    def _ensure_project_dir(self) -> None:
+        """确保项目级记忆目录存在（结果缓存，只做一次 mkdir）"""
+        if not self._project_dir_ready:
+            self._project_dir.mkdir(parents=True, exist_ok=True)
+            self._project_dir_ready = True
+
+    def _read_cached(self, path: Path) -> str | None:
+        """带缓存地读取记忆文件
+
+        以 mtime_ns + 文件大小作为有效性标记，未变化时直接返回
+        缓存内容；缓存按 LRU 淘汰，上限 READ_CACHE_SIZE 条。
+
+        Args:
+            path: 记忆文件路径
+
+        Returns:
+            文件内容，不存在则返回 None
+        """
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            self._read_cache.pop(key, None)
+            return None
+
+        cached = self._read_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            self._read_cache.move_to_end(key)
+            return cached[2]
+
+        try:
+            content = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            self._read_cache.pop(key, None)
+            return None
+
+        self._read_cache[key] = (st.st_mtime_ns, st.st_size, content)
+        self._read_cache.move_to_end(key)
+        if len(self._read_cache) > READ_CACHE_SIZE:
+            self._read_cache.popitem(last=False)
+        return content
+
+    def _invalidate_cache(self, path: Path) -> None:
+        """写入或删除后使对应的读缓存条目失效"""
+        self._read_cache.pop(str(path), None)
+
     def _get_user_path(self, key: str) -> Path:
         """获取用户级记忆文件路径"""
-        return self._user_dir / f"{key}.md"
-    
+        cache_key = ("u", key)
+        path = self._path_cache.get(cache_key)
+        if path is None:
+            path = self._path_cache[cache_key] = self._user_dir / f"{key}.md"
+        return path
+
     def _get_project_path(self, key: str) -> Path:
         """获取项目级记忆文件路径"""
-        return self._project_dir / f"{key}.md"
+        cache_key = ("p", key)
+        path = self._path_cache.get(cache_key)
+        if path is None:
+            path = self._path_cache[cache_key] = self._project_dir / f"{key}.md"
+        return path
     
     def save_user(self, key: str, content: str) -> Path:
         """保存用户级记忆
@@ -102,9 +205,10 @@ class MemoryStore:
         Returns:
             保存的文件路径
         """
-        self._user_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_user_dir()
         path = self._get_user_path(key)
-        path.write_text(content, encoding="utf-8")
+        path.write_bytes(content.encode("utf-8"))
+        self._invalidate_cache(path)
         return path
     
     def save_project(self, key: str, content: str) -> Path:
@@ -117,9 +221,10 @@ class MemoryStore:
         Returns:
             保存的文件路径
         """
-        self._project_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_project_dir()
         path = self._get_project_path(key)
-        path.write_text(content, encoding="utf-8")
+        path.write_bytes(content.encode("utf-8"))
+        self._invalidate_cache(path)
         return path
     
     def load_user(self, key: str) -> str | None:
@@ -131,11 +236,8 @@ class MemoryStore:
         Returns:
             记忆内容，不存在则返回 None
         """
-        path = self._get_user_path(key)
-        if path.exists():
-            return path.read_text(encoding="utf-8")
-        return None
-    
+        return self._read_cached(self._get_user_path(key))
+
     def load_project(self, key: str) -> str | None:
         """加载项目级记忆
         
@@ -145,11 +247,8 @@ class MemoryStore:
         Returns:
             记忆内容，不存在则返回 None
         """
-        path = self._get_project_path(key)
-        if path.exists():
-            return path.read_text(encoding="utf-8")
-        return None
-    
+        return self._read_cached(self._get_project_path(key))
+
     def load(self, key: str) -> str | None:
         """加载记忆（项目级优先）
         
@@ -165,6 +264,76 @@ class MemoryStore:
             return content
         return self.load_user(key)
     
+    def load_many(
+        self,
+        keys: Iterable[str],
+        project: bool = False,
+        max_workers: int | None = None,
+    ) -> dict[str, str]:
+        """批量加载记忆
+
+        单次目录扫描定位所有目标文件，避免逐个 key 的
+        exists+open 系统调用链；命中文件较多时用线程池
+        并发读取（文件 I/O 期间释放 GIL）。
+
+        Args:
+            keys: 记忆键集合
+            project: 是否从项目级目录加载
+            max_workers: 并发读取的线程数上限；None 表示按命中数
+                自动选择，1 表示强制串行
+
+        Returns:
+            key -> 内容 的字典（不存在的 key 不出现在结果中）
+        """
+        directory = self._project_dir if project else self._user_dir
+        wanted = set(keys)
+        hits: list[tuple[str, str]] = []  # (key, 文件路径)
+
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith(".md") and name[:-3] in wanted and entry.is_file():
+                        hits.append((name[:-3], entry.path))
+        except FileNotFoundError:
+            return {}
+
+        def _read(item: tuple[str, str]) -> tuple[str, str]:
+            return item[0], Path(item[1]).read_text(encoding="utf-8")
+
+        if len(hits) <= 2 or max_workers == 1:
+            return dict(map(_read, hits))
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        if max_workers is None:
+            max_workers = min(8, len(hits))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(pool.map(_read, hits))
+
+    async def aload_many(
+        self,
+        keys: Iterable[str],
+        project: bool = False,
+        max_workers: int | None = None,
+    ) -> dict[str, str]:
+        """异步批量加载记忆
+
+        在线程中运行阻塞的 load_many（含其内部并发读取），
+        不阻塞事件循环。
+
+        Args:
+            keys: 记忆键集合
+            project: 是否从项目级目录加载
+            max_workers: 并发读取的线程数上限
+
+        Returns:
+            key -> 内容 的字典（不存在的 key 不出现在结果中）
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.load_many, keys, project, max_workers)
+
     def delete_user(self, key: str) -> bool:
         """删除用户级记忆
         
@@ -175,11 +344,13 @@ class MemoryStore:
             是否删除成功
         """
         path = self._get_user_path(key)
-        if path.exists():
+        try:
             path.unlink()
-            return True
-        return False
-    
+        except FileNotFoundError:
+            return False
+        self._invalidate_cache(path)
+        return True
+
     def delete_project(self, key: str) -> bool:
         """删除项目级记忆
         
@@ -190,36 +361,45 @@ class MemoryStore:
             是否删除成功
         """
         path = self._get_project_path(key)
-        if path.exists():
+        try:
             path.unlink()
-            return True
-        return False
-    
+        except FileNotFoundError:
+            return False
+        self._invalidate_cache(path)
+        return True
+
+    @staticmethod
+    def _list_keys(directory: Path) -> list[str]:
+        """列出目录下所有 .md 文件的键名
+
+        os.scandir 的目录项自带文件类型，逐项判断无需额外 stat；
+        目录不存在按 EAFP 处理，省掉前置的 exists 检查。
+        """
+        try:
+            with os.scandir(directory) as it:
+                return [
+                    entry.name[:-3]
+                    for entry in it
+                    if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return []
+
     def list_user(self) -> list[str]:
         """列出所有用户级记忆键
-        
+
         Returns:
             记忆键列表
         """
-        if not self._user_dir.exists():
-            return []
-        return [
-            f.stem for f in self._user_dir.iterdir()
-            if f.is_file() and f.suffix == ".md"
-        ]
-    
+        return self._list_keys(self._user_dir)
+
     def list_project(self) -> list[str]:
         """列出所有项目级记忆键
-        
+
         Returns:
             记忆键列表
         """
-        if not self._project_dir.exists():
-            return []
-        return [
-            f.stem for f in self._project_dir.iterdir()
-            if f.is_file() and f.suffix == ".md"
-        ]
+        return self._list_keys(self._project_dir)
     
     def list_all(self) -> dict[str, list[str]]:
         """列出所有记忆
@@ -258,52 +438,103 @@ class MemoryStore:
             return self.save_project(agent_name, content)
         return self.save_user(agent_name, content)
     
-    def append_to_memory(self, key: str, content: str, project: bool = False) -> str:
+    def append_to_memory(self, key: str, content: str, project: bool = False) -> None:
         """追加内容到记忆
-        
+
+        以文件系统追加模式写入，成本只与新增内容成正比，
+        不再读回并重写整个文件。需要完整内容时请另行 load。
+
         Args:
             key: 记忆键
             content: 要追加的内容
             project: 是否追加到项目级记忆
-            
-        Returns:
-            更新后的完整内容
         """
-        existing = self.load_project(key) if project else self.load_user(key)
-        new_content = f"{existing}\n\n{content}" if existing else content
-        
         if project:
-            self.save_project(key, new_content)
+            self._ensure_project_dir()
+            path = self._get_project_path(key)
         else:
-            self.save_user(key, new_content)
-        
-        return new_content
+            self._ensure_user_dir()
+            path = self._get_user_path(key)
+
+        try:
+            empty = os.stat(path).st_size == 0
+        except FileNotFoundError:
+            empty = True
+
+        data = content.encode("utf-8")
+        with open(path, "ab") as f:
+            f.write(data if empty else b"\n\n" + data)
+        self._invalidate_cache(path)
     
+    def _search_file(self, path: Path, query_bytes: bytes) -> str | None:
+        """在单个记忆文件中做不区分大小写的字节级搜索
+
+        先在原始字节上查找，未命中时完全跳过 UTF-8 解码和
+        小写化分配——搜索中绝大多数文件都是未命中。
+
+        Args:
+            path: 记忆文件路径
+            query_bytes: 已小写化并编码的查询字节串
+
+        Returns:
+            命中时返回解码后的文件内容，否则返回 None
+        """
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return None
+        if raw.translate(_ASCII_LOWER).find(query_bytes) == -1:
+            return None
+        try:
+            return raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
     def search(self, query: str, include_user: bool = True, include_project: bool = True) -> list[tuple[str, str, str]]:
         """搜索记忆
-        
+
         Args:
             query: 搜索查询
             include_user: 是否搜索用户级记忆
             include_project: 是否搜索项目级记忆
-            
+
         Returns:
             匹配的记忆列表，每项为 (source, key, content) 元组
         """
         results: list[tuple[str, str, str]] = []
+
+        if query.isascii():
+            # ASCII 查询走字节级快速路径，未命中的文件不解码
+            query_bytes = query.encode("ascii").translate(_ASCII_LOWER)
+
+            if include_user:
+                for key in self.list_user():
+                    content = self._search_file(self._get_user_path(key), query_bytes)
+                    if content is not None:
+                        results.append(("user", key, content))
+
+            if include_project:
+                for key in self.list_project():
+                    content = self._search_file(self._get_project_path(key), query_bytes)
+                    if content is not None:
+                        results.append(("project", key, content))
+
+            return results
+
+        # 非 ASCII 查询需要完整的 Unicode 大小写折叠
         query_lower = query.lower()
-        
+
         if include_user:
             for key in self.list_user():
                 content = self.load_user(key)
                 if content and query_lower in content.lower():
                     results.append(("user", key, content))
-        
+
         if include_project:
             for key in self.list_project():
                 content = self.load_project(key)
                 if content and query_lower in content.lower():
                     results.append(("project", key, content))
-        
+
         return results
 
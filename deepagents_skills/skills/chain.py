@@ -5,7 +5,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable
@@ -14,6 +13,8 @@ from deepagents_skills.skills.executor import ExecutionContext, ExecutionResult
 from deepagents_skills.skills.model import Skill
 
 if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
     from deepagents_skills.skills.executor import SkillExecutor
 
 
@@ -23,7 +24,7 @@ class ChainMode(Enum):
     PARALLEL = "parallel"      # 并行执行
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChainStep:
     """链式执行步骤
     
@@ -49,7 +50,7 @@ class ChainStep:
         return self.transform(result, context)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainResult:
     """链式执行结果
     
@@ -74,6 +75,44 @@ class ChainResult:
         self.skipped.append(skill_name)
 
 
+@dataclass(slots=True)
+class SequentialStage:
+    """串行执行阶段
+
+    Attributes:
+        skills: 技能名称列表
+    """
+    skills: list[str]
+
+
+@dataclass(slots=True)
+class ParallelStage:
+    """并行执行阶段
+
+    Attributes:
+        skills: 技能名称列表
+    """
+    skills: list[str]
+
+
+@dataclass(slots=True)
+class BranchStage:
+    """条件分支阶段
+
+    Attributes:
+        condition: 条件函数
+        if_true: 条件为真时执行的技能名称列表
+        if_false: 条件为假时执行的技能名称列表
+    """
+    condition: Callable[[ExecutionContext], bool]
+    if_true: list[str]
+    if_false: list[str]
+
+
+# 流水线阶段类型
+PipelineStage = SequentialStage | ParallelStage | BranchStage
+
+
 class SkillChain:
     """技能链
     
@@ -95,7 +134,26 @@ class SkillChain:
         """
         self.executor = executor
         self._steps: list[ChainStep] = []
-    
+        # 已解析技能的缓存，按注册表版本号校验有效性
+        self._resolved: dict[str, Skill | None] = {}
+        self._resolved_version = -1
+
+    def _resolve(self, skill_name: str) -> Skill | None:
+        """解析技能名称并缓存结果
+
+        注册表未变更时，同一条链反复执行不再重复查表。
+        """
+        registry = self.executor.registry
+        if self._resolved_version != registry.version:
+            self._resolved.clear()
+            self._resolved_version = registry.version
+        try:
+            return self._resolved[skill_name]
+        except KeyError:
+            skill = registry.get(skill_name)
+            self._resolved[skill_name] = skill
+            return skill
+
     def add(
         self,
         skill_name: str,
@@ -146,12 +204,11 @@ class SkillChain:
                 continue
             
             # 获取技能
-            skill = self.executor.registry.get(step.skill_name)
+            skill = self._resolve(step.skill_name)
             if skill is None:
                 chain_result.add_result(ExecutionResult(
                     skill=Skill(
                         metadata=None,
-                        content="",
                         instructions="",
                         path=None,
                         source=None,
@@ -168,7 +225,7 @@ class SkillChain:
             # 转换结果
             if result.success and step.transform:
                 result.output = step.transform_result(result.output, context)
-                context.set_result(skill.name, result.output)
+                context.results[skill.name] = result.output
             
             chain_result.add_result(result)
             
@@ -231,8 +288,38 @@ class SkillPipeline:
             executor: 技能执行器
         """
         self.executor = executor
-        self._stages: list[dict[str, Any]] = []
-    
+        self._stages: list[PipelineStage] = []
+        self._pool: "ThreadPoolExecutor" | None = None
+        # 已解析技能的缓存，按注册表版本号校验有效性
+        self._resolved: dict[str, Skill | None] = {}
+        self._resolved_version = -1
+
+    def _resolve(self, skill_name: str) -> Skill | None:
+        """解析技能名称并缓存结果
+
+        注册表未变更时，流水线反复执行不再重复查表。
+        """
+        registry = self.executor.registry
+        if self._resolved_version != registry.version:
+            self._resolved.clear()
+            self._resolved_version = registry.version
+        try:
+            return self._resolved[skill_name]
+        except KeyError:
+            skill = registry.get(skill_name)
+            self._resolved[skill_name] = skill
+            return skill
+
+    def _get_pool(self) -> "ThreadPoolExecutor":
+        """懒创建并行阶段使用的线程池"""
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._pool = ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="skill-pipeline"
+            )
+        return self._pool
+
     def add_sequential(self, skill_names: list[str]) -> "SkillPipeline":
         """添加串行执行阶段
         
@@ -242,10 +329,7 @@ class SkillPipeline:
         Returns:
             self
         """
-        self._stages.append({
-            "mode": ChainMode.SEQUENTIAL,
-            "skills": skill_names,
-        })
+        self._stages.append(SequentialStage(skills=skill_names))
         return self
     
     def add_parallel(self, skill_names: list[str]) -> "SkillPipeline":
@@ -257,10 +341,7 @@ class SkillPipeline:
         Returns:
             self
         """
-        self._stages.append({
-            "mode": ChainMode.PARALLEL,
-            "skills": skill_names,
-        })
+        self._stages.append(ParallelStage(skills=skill_names))
         return self
     
     def add_branch(
@@ -279,13 +360,43 @@ class SkillPipeline:
         Returns:
             self
         """
-        self._stages.append({
-            "mode": "branch",
-            "condition": condition,
-            "if_true": if_true if isinstance(if_true, list) else [if_true],
-            "if_false": (if_false if isinstance(if_false, list) else [if_false]) if if_false else [],
-        })
+        self._stages.append(BranchStage(
+            condition=condition,
+            if_true=if_true if isinstance(if_true, list) else [if_true],
+            if_false=(if_false if isinstance(if_false, list) else [if_false]) if if_false else [],
+        ))
         return self
+
+    def _run_serial(
+        self,
+        skill_names: list[str],
+        context: ExecutionContext,
+        chain_result: ChainResult,
+        stop_on_failure: bool = True,
+    ) -> bool:
+        """按顺序执行一组技能
+
+        Args:
+            skill_names: 技能名称列表
+            context: 执行上下文
+            chain_result: 累积结果
+            stop_on_failure: 失败时是否终止
+
+        Returns:
+            是否应继续执行后续阶段
+        """
+        for skill_name in skill_names:
+            skill = self._resolve(skill_name)
+            if skill is None:
+                chain_result.add_skipped(skill_name)
+                continue
+
+            result = self.executor.execute(skill, context)
+            chain_result.add_result(result)
+
+            if stop_on_failure and not result.success:
+                return False
+        return True
     
     def execute(self, context: ExecutionContext | None = None) -> ChainResult:
         """同步执行流水线
@@ -300,50 +411,25 @@ class SkillPipeline:
             context = ExecutionContext()
         
         chain_result = ChainResult()
-        
+
         for stage in self._stages:
-            mode = stage["mode"]
-            
-            if mode == ChainMode.SEQUENTIAL:
-                for skill_name in stage["skills"]:
-                    skill = self.executor.registry.get(skill_name)
-                    if skill is None:
-                        chain_result.add_skipped(skill_name)
-                        continue
-                    
-                    result = self.executor.execute(skill, context)
-                    chain_result.add_result(result)
-                    
-                    if not result.success:
-                        return chain_result
-            
-            elif mode == ChainMode.PARALLEL:
+            if isinstance(stage, SequentialStage):
+                if not self._run_serial(stage.skills, context, chain_result):
+                    return chain_result
+
+            elif isinstance(stage, ParallelStage):
                 # 同步模式下，并行执行退化为串行
-                for skill_name in stage["skills"]:
-                    skill = self.executor.registry.get(skill_name)
-                    if skill is None:
-                        chain_result.add_skipped(skill_name)
-                        continue
-                    
-                    result = self.executor.execute(skill, context)
-                    chain_result.add_result(result)
-            
-            elif mode == "branch":
-                condition = stage["condition"]
-                skills_to_run = stage["if_true"] if condition(context) else stage["if_false"]
-                
-                for skill_name in skills_to_run:
-                    skill = self.executor.registry.get(skill_name)
-                    if skill is None:
-                        chain_result.add_skipped(skill_name)
-                        continue
-                    
-                    result = self.executor.execute(skill, context)
-                    chain_result.add_result(result)
-                    
-                    if not result.success:
-                        return chain_result
-        
+                self._run_serial(
+                    stage.skills, context, chain_result, stop_on_failure=False
+                )
+
+            else:
+                skills_to_run = (
+                    stage.if_true if stage.condition(context) else stage.if_false
+                )
+                if not self._run_serial(skills_to_run, context, chain_result):
+                    return chain_result
+
         if chain_result.steps:
             chain_result.final_output = chain_result.steps[-1].output
         
@@ -353,67 +439,64 @@ class SkillPipeline:
         """异步执行流水线
         
         支持真正的并行执行。
-        
+
         Args:
             context: 执行上下文
-            
+
         Returns:
             执行结果
         """
+        # asyncio 只有异步路径需要，函数内导入避免
+        # 同步使用场景为它付出模块导入开销
+        import asyncio
+
         if context is None:
             context = ExecutionContext()
         
         chain_result = ChainResult()
-        
+
         for stage in self._stages:
-            mode = stage["mode"]
-            
-            if mode == ChainMode.SEQUENTIAL:
-                for skill_name in stage["skills"]:
-                    skill = self.executor.registry.get(skill_name)
-                    if skill is None:
-                        chain_result.add_skipped(skill_name)
-                        continue
-                    
-                    result = self.executor.execute(skill, context)
-                    chain_result.add_result(result)
-                    
-                    if not result.success:
-                        return chain_result
-            
-            elif mode == ChainMode.PARALLEL:
-                # 并行执行
-                async def execute_skill(skill_name: str) -> ExecutionResult | None:
-                    skill = self.executor.registry.get(skill_name)
+            if isinstance(stage, SequentialStage):
+                if not self._run_serial(stage.skills, context, chain_result):
+                    return chain_result
+
+            elif isinstance(stage, ParallelStage):
+                # 并行执行：技能处理器是同步（可能阻塞的）调用，
+                # 直接放进协程只会在事件循环线程上串行跑，
+                # 必须提交到线程池才有真正的并发。
+                # 上下文写入是 dict 赋值，在 GIL 下本身是原子的
+                loop = asyncio.get_running_loop()
+                pool = self._get_pool()
+
+                names = stage.skills
+                futures: list[Any] = []
+                for skill_name in names:
+                    skill = self._resolve(skill_name)
                     if skill is None:
-                        return None
-                    return self.executor.execute(skill, context)
-                
-                tasks = [execute_skill(name) for name in stage["skills"]]
-                results = await asyncio.gather(*tasks)
-                
-                for i, result in enumerate(results):
-                    if result is None:
-                        chain_result.add_skipped(stage["skills"][i])
+                        futures.append(None)
                     else:
-                        chain_result.add_result(result)
-            
-            elif mode == "branch":
-                condition = stage["condition"]
-                skills_to_run = stage["if_true"] if condition(context) else stage["if_false"]
-                
-                for skill_name in skills_to_run:
-                    skill = self.executor.registry.get(skill_name)
-                    if skill is None:
+                        futures.append(
+                            loop.run_in_executor(
+                                pool, self.executor.execute, skill, context
+                            )
+                        )
+
+                results = iter(
+                    await asyncio.gather(*(f for f in futures if f is not None))
+                )
+                for skill_name, future in zip(names, futures):
+                    if future is None:
                         chain_result.add_skipped(skill_name)
-                        continue
-                    
-                    result = self.executor.execute(skill, context)
-                    chain_result.add_result(result)
-                    
-                    if not result.success:
-                        return chain_result
-        
+                    else:
+                        chain_result.add_result(next(results))
+
+            else:
+                skills_to_run = (
+                    stage.if_true if stage.condition(context) else stage.if_false
+                )
+                if not self._run_serial(skills_to_run, context, chain_result):
+                    return chain_result
+
         if chain_result.steps:
             chain_result.final_output = chain_result.steps[-1].output
         
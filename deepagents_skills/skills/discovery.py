@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,6 +15,9 @@ from deepagents_skills.skills.model import Skill, SkillSource
 if TYPE_CHECKING:
     from deepagents_skills.config import Config
 
+# 目录扫描缓存的有效期（秒）
+SCAN_CACHE_TTL = 20.0
+
 
 class SkillDiscovery:
     """技能发现服务
@@ -39,44 +43,126 @@ class SkillDiscovery:
         self.config = config
         self._user_skills_dir = config.skills.user_dir
         self._project_skills_dir = config.skills.project_dir
-    
+        # 扫描缓存：目录 -> (目录 mtime, 缓存时间, 技能列表)
+        self._scan_cache: dict[Path, tuple[float, float, list[Skill]]] = {}
+        # 目录存在性缓存：不存在的目录直接走空结果快路径，
+        # refresh 时重新检查
+        self._user_dir_exists = self._user_skills_dir.expanduser().is_dir()
+        self._project_dir_exists = self._project_skills_dir.expanduser().is_dir()
+
+    @staticmethod
+    def _dir_mtime(directory: Path) -> float:
+        """获取目录 mtime，不可访问时返回 -1.0"""
+        try:
+            return directory.expanduser().stat().st_mtime
+        except OSError:
+            return -1.0
+
+    def _cache_get(self, directory: Path) -> list[Skill] | None:
+        """获取目录的有效扫描缓存，失效或不存在返回 None"""
+        cached = self._scan_cache.get(directory)
+        if cached is not None:
+            cached_mtime, cached_at, skills = cached
+            if (
+                cached_mtime == self._dir_mtime(directory)
+                and time.monotonic() - cached_at < SCAN_CACHE_TTL
+            ):
+                return list(skills)
+        return None
+
+    def _list_cached(self, directory: Path, source: SkillSource) -> list[Skill]:
+        """带短 TTL 缓存的目录扫描
+
+        同一目录在 TTL 内且 mtime 未变时直接复用上次结果，
+        避免多智能体共享目录时的重复磁盘扫描。
+        """
+        skills = self._cache_get(directory)
+        if skills is not None:
+            return skills
+
+        dir_mtime = self._dir_mtime(directory)
+        skills = list_skills_in_directory(directory, source)
+        self._scan_cache[directory] = (dir_mtime, time.monotonic(), skills)
+        return list(skills)
+
     def discover_user_skills(self) -> list[Skill]:
         """发现用户级技能
-        
+
         Returns:
             用户级技能列表
         """
-        return list_skills_in_directory(self._user_skills_dir, SkillSource.USER)
-    
+        if not self._user_dir_exists:
+            return []
+        return self._list_cached(self._user_skills_dir, SkillSource.USER)
+
     def discover_project_skills(self) -> list[Skill]:
         """发现项目级技能
-        
+
         Returns:
             项目级技能列表
         """
-        return list_skills_in_directory(self._project_skills_dir, SkillSource.PROJECT)
+        if not self._project_dir_exists:
+            return []
+        return self._list_cached(self._project_skills_dir, SkillSource.PROJECT)
     
     def discover_all(self) -> list[Skill]:
         """发现所有技能
-        
-        项目级技能会覆盖同名的用户级技能。
-        
+
+        项目级技能会覆盖同名的用户级技能。先扫描项目级目录，
+        用户级目录中被同名项目技能遮蔽的技能目录直接跳过，
+        不再白白解析一遍。
+
+        Returns:
+            合并后的技能列表
+        """
+        # 先加载项目级技能（优先级最高）
+        project_skills = self.discover_project_skills()
+
+        # 用户级目录不存在时无需合并，直接返回项目级结果
+        if not self._user_dir_exists:
+            return project_skills
+
+        skills_dict: dict[str, Skill] = {
+            skill.name: skill for skill in project_skills
+        }
+
+        # 用户级目录：缓存有效时在内存中过滤；否则带排除集扫描。
+        # 过滤后的列表不完整，不写入扫描缓存
+        user_skills = self._cache_get(self._user_skills_dir)
+        if user_skills is None:
+            user_skills = list_skills_in_directory(
+                self._user_skills_dir, SkillSource.USER, exclude_names=skills_dict.keys()
+            )
+
+        for skill in user_skills:
+            skills_dict.setdefault(skill.name, skill)
+
+        return list(skills_dict.values())
+    
+    async def adiscover_all(self) -> list[Skill]:
+        """异步发现所有技能
+
+        用户级和项目级目录的扫描在线程中并发执行，
+        合并语义与 discover_all 一致（项目级覆盖用户级）。
+
         Returns:
             合并后的技能列表
         """
-        # 用字典存储，用于去重（项目级覆盖用户级）
+        import asyncio
+
+        user_skills, project_skills = await asyncio.gather(
+            asyncio.to_thread(self.discover_user_skills),
+            asyncio.to_thread(self.discover_project_skills),
+        )
+
         skills_dict: dict[str, Skill] = {}
-        
-        # 先加载用户级技能
-        for skill in self.discover_user_skills():
+        for skill in user_skills:
             skills_dict[skill.name] = skill
-        
-        # 再加载项目级技能（覆盖同名用户级技能）
-        for skill in self.discover_project_skills():
+        for skill in project_skills:
             skills_dict[skill.name] = skill
-        
+
         return list(skills_dict.values())
-    
+
     def discover_from_directory(self, directory: Path | str, source: SkillSource = SkillSource.USER) -> list[Skill]:
         """从指定目录发现技能
         
@@ -89,14 +175,26 @@ class SkillDiscovery:
         """
         return list_skills_in_directory(Path(directory), source)
     
+    def invalidate(self) -> None:
+        """清空扫描缓存并重新检查目录存在性
+
+        之后的 discover_* 调用保证重新读盘；修改已有 SKILL.md
+        不会改变目录 mtime，显式刷新前必须先失效缓存。同时
+        重查目录存在性，让构造之后才创建的技能目录也能被发现。
+        """
+        self._scan_cache.clear()
+        self._user_dir_exists = self._user_skills_dir.expanduser().is_dir()
+        self._project_dir_exists = self._project_skills_dir.expanduser().is_dir()
+
     def refresh(self) -> list[Skill]:
         """刷新技能列表
-        
-        重新扫描所有目录，返回最新的技能列表。
-        
+
+        清空扫描缓存并重新扫描所有目录，返回最新的技能列表。
+
         Returns:
             最新的技能列表
         """
+        self.invalidate()
         return self.discover_all()
 
 
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from deepagents_skills.skills.registry import SkillRegistry
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """技能执行上下文
     
@@ -31,14 +31,17 @@ class ExecutionContext:
     results: dict[str, Any] = field(default_factory=dict)
     metadata: dict[str, Any] = field(default_factory=dict)
     
-    def set_result(self, skill_name: str, result: Any) -> None:
-        """设置技能执行结果"""
+    def __setitem__(self, skill_name: str, result: Any) -> None:
+        """设置技能执行结果：ctx[name] = output"""
         self.results[skill_name] = result
-    
-    def get_result(self, skill_name: str) -> Any | None:
-        """获取技能执行结果"""
-        return self.results.get(skill_name)
-    
+
+    def __getitem__(self, skill_name: str) -> Any:
+        """获取技能执行结果：ctx[name]，不存在时抛出 KeyError"""
+        return self.results[skill_name]
+
+    def __contains__(self, skill_name: str) -> bool:
+        return skill_name in self.results
+
     def set_variable(self, name: str, value: Any) -> None:
         """设置变量"""
         self.variables[name] = value
@@ -47,8 +50,19 @@ class ExecutionContext:
         """获取变量"""
         return self.variables.get(name, default)
 
+    def reset(self) -> None:
+        """清空上下文以便复用
 
-@dataclass
+        在紧凑循环中反复执行链/流水线时，复用同一个上下文
+        实例可以避免每轮重新分配三个字典。
+        """
+        self.query = ""
+        self.variables.clear()
+        self.results.clear()
+        self.metadata.clear()
+
+
+@dataclass(slots=True)
 class ExecutionResult:
     """技能执行结果
     
@@ -125,38 +139,112 @@ class SkillExecutor:
     
     def resolve_dependencies(self, skill: Skill, resolved: set[str] | None = None) -> list[Skill]:
         """解析技能依赖
-        
-        使用深度优先搜索解析依赖，处理循环依赖。
-        
+
+        委托给注册表缓存的迭代拓扑排序（循环依赖会被跳过）。
+
         Args:
             skill: 要解析依赖的技能
-            resolved: 已解析的技能名称集合（用于检测循环依赖）
-            
+            resolved: 已解析的技能名称集合（其中的技能不再返回）
+
         Returns:
             按依赖顺序排列的技能列表（依赖在前）
         """
+        order = self.registry.dependency_order(skill.name)
+        if not order:
+            # 未注册的技能：声明的依赖仍通过注册表解析（已注册的
+            # 依赖连同其传递依赖在前），最后附加技能自身，与旧版
+            # DFS 行为一致；未注册的依赖名与旧版一样被跳过
+            seen: set[str] = set()
+            deps: list[Skill] = []
+            for dep_name in skill.dependencies:
+                for s in self.registry.dependency_order(dep_name):
+                    if s.name not in seen:
+                        seen.add(s.name)
+                        deps.append(s)
+            if skill.name not in seen:
+                deps.append(skill)
+            order = deps
+
         if resolved is None:
-            resolved = set()
-        
-        result: list[Skill] = []
-        
-        # 检测循环依赖
+            return list(order)
+
+        # 跨多次调用去重：已解析过的技能不再返回。
+        # 单次遍历同时完成过滤和集合更新，不分配中间列表
         if skill.name in resolved:
-            return result
-        
-        resolved.add(skill.name)
-        
-        # 先解析依赖
-        for dep_name in skill.dependencies:
-            dep_skill = self.registry.get(dep_name)
-            if dep_skill and dep_skill.name not in resolved:
-                result.extend(self.resolve_dependencies(dep_skill, resolved))
-        
-        # 最后添加当前技能
-        result.append(skill)
-        
+            return []
+        result: list[Skill] = []
+        for s in order:
+            if s.name not in resolved:
+                resolved.add(s.name)
+                result.append(s)
         return result
     
+    def resolve_dependency_levels(self, skill: Skill) -> list[list[Skill]]:
+        """把依赖图切分为可并行的层级
+
+        同一层内的技能互不依赖，可以并发执行；层与层之间
+        保持依赖顺序。层号为该技能到叶子依赖的最长路径长度。
+
+        Args:
+            skill: 要解析依赖的技能
+
+        Returns:
+            按执行顺序排列的层级列表，每层是互不依赖的技能列表
+        """
+        order = self.registry.dependency_order(skill.name) or (skill,)
+
+        depth: dict[str, int] = {}
+        levels: list[list[Skill]] = []
+        for s in order:
+            d = 0
+            for dep_name in s.dependencies:
+                if dep_name in depth:
+                    d = max(d, depth[dep_name] + 1)
+            depth[s.name] = d
+            if d == len(levels):
+                levels.append([s])
+            else:
+                levels[d].append(s)
+        return levels
+
+    async def execute_with_dependencies_async(
+        self,
+        skill: Skill,
+        context: ExecutionContext | None = None,
+    ) -> list[ExecutionResult]:
+        """异步执行技能及其依赖，同层依赖并发执行
+
+        每一层内的技能互不依赖，提交到线程并发运行（上下文写入
+        是 dict 赋值，在 GIL 下是原子的）；任意一层出现失败则
+        不再执行后续层级。
+
+        Args:
+            skill: 要执行的技能
+            context: 执行上下文
+
+        Returns:
+            所有已执行技能的结果列表
+        """
+        import asyncio
+
+        if context is None:
+            context = ExecutionContext()
+
+        results: list[ExecutionResult] = []
+        for level in self.resolve_dependency_levels(skill):
+            if len(level) == 1:
+                level_results = [await asyncio.to_thread(self.execute, level[0], context)]
+            else:
+                level_results = list(await asyncio.gather(
+                    *(asyncio.to_thread(self.execute, s, context) for s in level)
+                ))
+            results.extend(level_results)
+
+            if not all(r.success for r in level_results):
+                break
+
+        return results
+
     def execute(
         self,
         skill: Skill,
@@ -176,7 +264,7 @@ class SkillExecutor:
         
         try:
             output = self._handler(skill, context)
-            context.set_result(skill.name, output)
+            context.results[skill.name] = output
             return ExecutionResult(
                 skill=skill,
                 success=True,
@@ -189,6 +277,26 @@ class SkillExecutor:
                 error=str(e),
             )
     
+    async def aexecute(
+        self,
+        skill: Skill,
+        context: ExecutionContext | None = None,
+    ) -> ExecutionResult:
+        """异步执行单个技能
+
+        在线程中运行（可能阻塞的）技能处理器，不阻塞事件循环。
+
+        Args:
+            skill: 要执行的技能
+            context: 执行上下文
+
+        Returns:
+            执行结果
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.execute, skill, context)
+
     def execute_with_dependencies(
         self,
         skill: Skill,
@@ -245,15 +353,16 @@ class SkillExecutor:
         else:
             context.query = query
         
-        # 匹配技能
-        matched_skills = self.match(query)
-        
-        if not matched_skills:
+        # 匹配技能；默认的 top-1 情况走不排序的 argmax 快路径
+        if max_skills == 1:
+            top = self.registry.match_top1(query)
+            skills_to_execute = [top] if top is not None else []
+        else:
+            skills_to_execute = self.match(query)[:max_skills]
+
+        if not skills_to_execute:
             return []
         
-        # 限制执行数量
-        skills_to_execute = matched_skills[:max_skills]
-        
         results: list[ExecutionResult] = []
         for skill in skills_to_execute:
             # 执行技能及其依赖
@@ -278,18 +387,11 @@ class SkillExecutor:
     
     def list_available_skills(self) -> list[dict[str, Any]]:
         """列出所有可用技能的摘要信息
-        
+
+        复用注册表缓存的摘要列表，重复调用不重建字典。
+
         Returns:
             技能摘要列表
         """
-        return [
-            {
-                "name": skill.name,
-                "description": skill.description,
-                "triggers": skill.triggers,
-                "source": skill.source.value,
-                "priority": skill.priority,
-            }
-            for skill in self.registry.get_all()
-        ]
+        return self.registry.list_summaries()
 
@@ -5,62 +5,317 @@
 
 from __future__ import annotations
 
+import mmap
+import os
 import re
+import stat as stat_module
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Container
 
 from deepagents_skills.skills.model import Skill, SkillMetadata, SkillSource
 
 if TYPE_CHECKING:
     pass
 
+try:
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as _YamlLoader  # libyaml，C 实现
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+    _HAS_YAML = True
+except ImportError:
+    # PyYAML 不可用时退回手写的扁平键值解析
+    _HAS_YAML = False
+
 # SKILL.md 文件最大大小 (10MB)
 MAX_SKILL_FILE_SIZE = 10 * 1024 * 1024
 
+# 先读取的前缀大小：frontmatter 通常远小于 4KB，
+# 前缀校验不通过时可以避免读入整个文件
+_PREFIX_SIZE = 4096
+
+# 目录扫描里拼接候选路径用的固定后缀
+_SKILL_MD_SUFFIX = os.sep + "SKILL.md"
+
+# 超过该大小的文件正文用 mmap 读取，避免分块 read + join 的
+# 中间拷贝（上限 10MB 内的大技能文件）
+_MMAP_THRESHOLD = 256 * 1024
+
+# 扁平 frontmatter 解析用的预编译正则
+_LIST_RE = re.compile(r"^\s*-\s+(.+)$")
+_KV_RE = re.compile(r"^(\w+):\s*(.*)$")
+
+# YAML 前的快速路径：只接受无引号、无特殊语法的 `key: 标量` 行
+# 和一层 `- 项` 列表块（SKILL.md 的规范形状）；其余交还给 PyYAML
+_FAST_LINE_RE = re.compile(r"^([A-Za-z_][\w-]*):(?:[ \t]+(\S.*))?[ \t]*$")
+_INT_RE = re.compile(r"-?\d+$")
+# 这些值在 YAML 里有特殊含义（布尔/空值），快速路径不模仿其语义
+_YAML_WORDS = frozenset(
+    {"true", "false", "null", "yes", "no", "on", "off", "~"}
+)
+_YAML_SPECIAL_HEADS = '[{|>"\'&*!#'
+
+# 已解析技能的 LRU 缓存：路径 -> (mtime_ns, size, Skill)。
+# refresh 重新扫描时，stat 未变化的文件直接复用上次解析结果；
+# 超出容量时淘汰最久未使用的条目，避免长期运行无界增长
+_SKILL_CACHE_SIZE = 1024
+_skill_cache: OrderedDict[Path, tuple[int, int, Skill]] = OrderedDict()
+# 缓存会被 list_skills_in_directory 的线程池并发读写，
+# OrderedDict 的 move_to_end/popitem 不是线程安全的
+_skill_cache_lock = threading.Lock()
+
+
+def invalidate(path: Path) -> None:
+    """从技能解析缓存中移除指定路径
+
+    Args:
+        path: SKILL.md 文件路径
+    """
+    with _skill_cache_lock:
+        _skill_cache.pop(path, None)
+
+
+@lru_cache(maxsize=64)
+def _resolved_base(path_str: str) -> str:
+    """技能根目录 realpath 的进程级缓存
+
+    realpath 会逐层 stat 路径组件；技能根目录在进程生命周期内
+    几乎不变，缓存后每次扫描只剩一次字典查找。
+
+    Args:
+        path_str: 技能根目录路径字符串
+
+    Returns:
+        realpath 结果加结尾分隔符
+    """
+    return os.path.realpath(path_str) + os.sep
+
+
+def _is_safe_path(path: str, base_prefix: str) -> bool:
+    """检查路径是否安全地包含在基目录中
 
-def _is_safe_path(path: Path, base_dir: Path) -> bool:
-    """检查路径是否安全地包含在 base_dir 中
-    
     防止通过符号链接或路径操作进行目录遍历攻击。
-    
+    基目录只在调用方 realpath 一次，这里对候选路径做单次
+    realpath 后按字符串前缀比较，比逐项 Path.resolve 便宜。
+
     Args:
         path: 要验证的路径
-        base_dir: 应该包含路径的基目录
-        
+        base_prefix: 已 realpath 的基目录，带结尾分隔符
+
     Returns:
-        如果路径安全地在 base_dir 中则返回 True
+        如果路径安全地在基目录中则返回 True
     """
     try:
-        resolved_path = path.resolve()
-        resolved_base = base_dir.resolve()
-        resolved_path.relative_to(resolved_base)
-        return True
-    except ValueError:
-        return False
+        return os.path.realpath(path).startswith(base_prefix)
     except (OSError, RuntimeError):
         return False
 
 
+def _split_frontmatter(content: str) -> tuple[str, str] | None:
+    """按 --- 分隔符切分 frontmatter 与正文
+
+    基于 str.find 的两指针扫描（C 级），不使用 DOTALL 正则。
+
+    Args:
+        content: SKILL.md 文件内容
+
+    Returns:
+        (frontmatter 文本, 正文) 元组，格式不符返回 None
+    """
+    if not content.startswith("---"):
+        return None
+    head_end = content.find("\n")
+    if head_end == -1 or content[3:head_end].strip():
+        return None
+
+    close = content.find("\n---", head_end)
+    while close != -1:
+        line_end = content.find("\n", close + 1)
+        if line_end == -1:
+            return None
+        # 结束分隔符必须单独成行（允许尾部空白）
+        if not content[close + 4:line_end].strip():
+            return content[head_end + 1:close], content[line_end + 1:]
+        close = content.find("\n---", close + 1)
+    return None
+
+
+def _split_frontmatter_bytes(buf: bytes) -> tuple[bytes, int] | None:
+    """在字节缓冲上定位 frontmatter 与正文起点
+
+    与 _split_frontmatter 同构，但工作在（可能不完整的）文件
+    前缀字节上；frontmatter 未在缓冲内闭合时返回 None。
+
+    Args:
+        buf: 文件前缀字节
+
+    Returns:
+        (frontmatter 字节, 正文起始偏移) 元组，未闭合返回 None
+    """
+    if not buf.startswith(b"---"):
+        return None
+    head_end = buf.find(b"\n")
+    if head_end == -1 or buf[3:head_end].strip():
+        return None
+
+    close = buf.find(b"\n---", head_end)
+    while close != -1:
+        line_end = buf.find(b"\n", close + 1)
+        if line_end == -1:
+            return None
+        if not buf[close + 4:line_end].strip():
+            return buf[head_end + 1:close], line_end + 1
+        close = buf.find(b"\n---", close + 1)
+    return None
+
+
+def _parse_frontmatter_dict(frontmatter: str) -> dict[str, any] | None:
+    """解析 frontmatter 文本为元数据字典
+
+    扁平标量走快速路径；否则优先 PyYAML 的 C 加载器（libyaml），
+    PyYAML 不可用时退回手写的扁平键值/列表解析。
+
+    Args:
+        frontmatter: 分隔符之间的 frontmatter 文本
+
+    Returns:
+        元数据字典，解析失败返回 None
+    """
+    fast = _try_fast_flat(frontmatter)
+    if fast is not None:
+        return fast
+
+    if _HAS_YAML:
+        try:
+            metadata = yaml.load(frontmatter, Loader=_YamlLoader)
+        except yaml.YAMLError:
+            return None
+        if not isinstance(metadata, dict):
+            return None
+        return metadata
+
+    return _parse_flat_frontmatter(frontmatter)
+
+
 def _parse_yaml_frontmatter(content: str) -> tuple[dict[str, any], str] | None:
     """解析 YAML frontmatter
-    
+
     Args:
         content: SKILL.md 文件内容
-        
+
     Returns:
         (元数据字典, 剩余内容) 元组，解析失败返回 None
     """
-    # 匹配 --- 分隔符之间的 YAML frontmatter
-    frontmatter_pattern = r"^---\s*\n(.*?)\n---\s*\n"
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
-    
-    if not match:
+    split = _split_frontmatter(content)
+    if split is None:
         return None
-    
-    frontmatter = match.group(1)
-    rest_content = content[match.end():]
-    
-    # 简单的 YAML 解析（支持基本的键值对和列表）
+    frontmatter, rest_content = split
+
+    metadata = _parse_frontmatter_dict(frontmatter)
+    if metadata is None:
+        return None
+    return metadata, rest_content
+
+
+def _fast_scalar(value: str) -> any:
+    """解析快速路径里的单个标量值
+
+    引号、流式集合、注释、YAML 关键字（true/null 等）和
+    非整数数字都不在快速路径覆盖范围内。
+
+    Args:
+        value: 去掉首尾空白的标量文本
+
+    Returns:
+        解析后的值（str 或 int）；形状不支持时返回 None
+    """
+    if value[0] in _YAML_SPECIAL_HEADS or " #" in value:
+        return None
+    if value.lower() in _YAML_WORDS:
+        return None
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if value.replace(".", "", 1).lstrip("-").isdigit():
+        # 浮点等其他数字形式交给 YAML
+        return None
+    return value
+
+
+def _try_fast_flat(frontmatter: str) -> dict[str, any] | None:
+    """尝试用逐行正则解析规范形状的 frontmatter
+
+    覆盖 SKILL.md 的典型形状：`key: 标量` 行加一层
+    `- 项` 列表块（triggers/dependencies）。出现更深嵌套、
+    引号、注释或 YAML 关键字时返回 None，交给完整解析器。
+    语义与 YAML 对这类输入的结果一致。
+
+    Args:
+        frontmatter: 分隔符之间的 frontmatter 文本
+
+    Returns:
+        元数据字典；形状不符合快速路径时返回 None
+    """
+    metadata: dict[str, any] = {}
+    current_list: list | None = None
+    pending_key: str | None = None
+
+    for line in frontmatter.split("\n"):
+        if not line.strip():
+            continue
+
+        if line[0] in " \t":
+            # 缩进行：只允许当前列表块的 `- 项`
+            stripped = line.strip()
+            if current_list is None or not stripped.startswith("- "):
+                return None
+            item = _fast_scalar(stripped[2:].strip())
+            if item is None:
+                return None
+            current_list.append(item)
+            continue
+
+        # 顶层键：上一个列表块若为空，YAML 语义是 None 值，不模仿
+        if current_list is not None and not current_list:
+            return None
+
+        m = _FAST_LINE_RE.match(line)
+        if m is None:
+            return None
+        key, value = m.groups()
+
+        if value is None:
+            # 空值开启列表块
+            current_list = metadata[key] = []
+            pending_key = key
+            continue
+
+        current_list = None
+        pending_key = None
+        parsed = _fast_scalar(value.rstrip())
+        if parsed is None:
+            return None
+        metadata[key] = parsed
+
+    if pending_key is not None and not metadata[pending_key]:
+        return None
+    return metadata if metadata else None
+
+
+def _parse_flat_frontmatter(frontmatter: str) -> dict[str, any]:
+    """手写的扁平 YAML 解析（支持基本的键值对和列表）
+
+    Args:
+        frontmatter: 分隔符之间的 frontmatter 文本
+
+    Returns:
+        元数据字典
+    """
     metadata: dict[str, any] = {}
     current_key = None
     current_list = None
@@ -71,7 +326,7 @@ def _parse_yaml_frontmatter(content: str) -> tuple[dict[str, any], str] | None:
             continue
         
         # 检查是否是列表项
-        list_match = re.match(r"^\s*-\s+(.+)$", line)
+        list_match = _LIST_RE.match(line)
         if list_match and current_key:
             if current_list is None:
                 current_list = []
@@ -85,7 +340,7 @@ def _parse_yaml_frontmatter(content: str) -> tuple[dict[str, any], str] | None:
             continue
         
         # 检查是否是键值对
-        kv_match = re.match(r"^(\w+):\s*(.*)$", line.strip())
+        kv_match = _KV_RE.match(line.strip())
         if kv_match:
             key, value = kv_match.groups()
             value = value.strip()
@@ -104,57 +359,123 @@ def _parse_yaml_frontmatter(content: str) -> tuple[dict[str, any], str] | None:
                     pass
                 metadata[key] = value
             # 如果值为空，可能是列表的开始
-    
-    return metadata, rest_content
+
+    return metadata
 
 
-def load_skill(skill_md_path: Path, source: SkillSource) -> Skill | None:
+def load_skill(
+    skill_md_path: Path,
+    source: SkillSource,
+    st: os.stat_result | None = None,
+) -> Skill | None:
     """从 SKILL.md 文件加载技能
-    
+
     Args:
         skill_md_path: SKILL.md 文件路径
         source: 技能来源（用户级或项目级）
-        
+        st: 调用方已持有的 stat 结果（目录扫描时复用，免二次 stat）
+
     Returns:
         Skill 实例，加载失败返回 None
     """
     try:
+        if st is None:
+            st = skill_md_path.stat()
+
         # 安全检查：文件大小
-        file_size = skill_md_path.stat().st_size
-        if file_size > MAX_SKILL_FILE_SIZE:
+        if st.st_size > MAX_SKILL_FILE_SIZE:
             return None
-        
-        # 读取文件内容
-        content = skill_md_path.read_text(encoding="utf-8")
-        
-        # 解析 frontmatter
-        result = _parse_yaml_frontmatter(content)
-        if result is None:
-            return None
-        
-        metadata_dict, instructions = result
-        
-        # 验证必需字段
-        if "name" not in metadata_dict or "description" not in metadata_dict:
-            return None
-        
-        # 创建元数据
+
+        # stat 未变化时复用缓存的解析结果，跳过读取和解析
+        with _skill_cache_lock:
+            cached = _skill_cache.get(skill_md_path)
+            if (
+                cached is not None
+                and cached[0] == st.st_mtime_ns
+                and cached[1] == st.st_size
+                and cached[2].source is source
+            ):
+                _skill_cache.move_to_end(skill_md_path)
+                return cached[2]
+
+        # 用 os.open/os.read 读取：先读 4KB 前缀。frontmatter 通常
+        # 整个落在前缀内，可以先解析和校验元数据，确认有效后才
+        # 读取正文；无效文件（无 --- 头或元数据不合法）完全不读正文
+        fd = os.open(skill_md_path, os.O_RDONLY)
+        try:
+            head = os.read(fd, _PREFIX_SIZE)
+            if not head.startswith(b"---"):
+                return None
+
+            split = _split_frontmatter_bytes(head)
+            if split is not None:
+                frontmatter_bytes, body_offset = split
+                metadata_dict = _parse_frontmatter_dict(
+                    frontmatter_bytes.decode("utf-8")
+                )
+                if (
+                    metadata_dict is None
+                    or metadata_dict.get("name") is None
+                    or metadata_dict.get("description") is None
+                ):
+                    return None
+
+                # 元数据有效，读取正文作为 instructions
+                if st.st_size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                        instructions = mm[body_offset:].decode("utf-8")
+                elif st.st_size > len(head):
+                    chunks = [head[body_offset:]]
+                    while chunk := os.read(fd, 1 << 16):
+                        chunks.append(chunk)
+                    instructions = b"".join(chunks).decode("utf-8")
+                else:
+                    instructions = head[body_offset:].decode("utf-8")
+            else:
+                # frontmatter 超出前缀（或被前缀截断）：读整个文件
+                # 走字符串路径
+                chunks = [head]
+                while chunk := os.read(fd, 1 << 16):
+                    chunks.append(chunk)
+                result = _parse_yaml_frontmatter(b"".join(chunks).decode("utf-8"))
+                if result is None:
+                    return None
+                metadata_dict, instructions = result
+                if (
+                    metadata_dict.get("name") is None
+                    or metadata_dict.get("description") is None
+                ):
+                    return None
+        finally:
+            os.close(fd)
+
+
+        # 创建元数据。YAML 与快速路径都会把纯数字标量解析成 int
+        # （如 name: 123、triggers: [2024]），统一转成 str，保证
+        # 注册时的 intern 和匹配时的 lower() 不会崩溃；无值的键
+        # （如光秃秃的 triggers:）解析成 None，用 or 落回默认值，
+        # 与旧版扁平解析器跳过空键的行为一致
         metadata = SkillMetadata(
-            name=metadata_dict["name"],
+            name=str(metadata_dict["name"]),
             description=metadata_dict["description"],
-            triggers=metadata_dict.get("triggers", []),
-            dependencies=metadata_dict.get("dependencies", []),
-            priority=metadata_dict.get("priority", 0),
+            triggers=[str(t) for t in metadata_dict.get("triggers") or []],
+            dependencies=[str(d) for d in metadata_dict.get("dependencies") or []],
+            priority=metadata_dict.get("priority") or 0,
         )
         
-        return Skill(
+        # content 不常驻存储：Skill.content 首次访问时从 path 重读
+        skill = Skill(
             metadata=metadata,
-            content=content,
             instructions=instructions.strip(),
             path=skill_md_path,
             source=source,
         )
-    
+        with _skill_cache_lock:
+            _skill_cache[skill_md_path] = (st.st_mtime_ns, st.st_size, skill)
+            if len(_skill_cache) > _SKILL_CACHE_SIZE:
+                _skill_cache.popitem(last=False)
+        return skill
+
     except (OSError, UnicodeDecodeError):
         return None
 
@@ -171,54 +492,86 @@ def load_skill_from_directory(skill_dir: Path, source: SkillSource) -> Skill | N
     Returns:
         Skill 实例，加载失败返回 None
     """
-    skill_md_path = skill_dir / "SKILL.md"
-    if not skill_md_path.exists():
-        return None
-    return load_skill(skill_md_path, source)
+    # 不做 exists 预检：load_skill 内部的 stat 以 EAFP 方式
+    # 处理缺失文件，省一次系统调用
+    return load_skill(skill_dir / "SKILL.md", source)
 
 
-def list_skills_in_directory(skills_dir: Path, source: SkillSource) -> list[Skill]:
+def list_skills_in_directory(
+    skills_dir: Path,
+    source: SkillSource,
+    exclude_names: Container[str] | None = None,
+    max_workers: int | None = None,
+) -> list[Skill]:
     """列出目录中的所有技能
-    
+
     扫描技能目录，查找包含 SKILL.md 的子目录。
-    
+    使用 os.scandir 复用目录项自带的类型信息，避免逐项 stat。
+
     Args:
         skills_dir: 技能根目录
         source: 技能来源
-        
+        exclude_names: 要跳过的技能目录名集合（按目录名匹配，
+            在打开和解析 SKILL.md 之前过滤）
+        max_workers: 并行加载的线程数上限；None 表示按候选数
+            自动选择，1 表示强制串行
+
     Returns:
         技能列表
     """
     skills_dir = skills_dir.expanduser()
-    if not skills_dir.exists():
-        return []
-    
+
+    candidates: list[tuple[Path, os.stat_result]] = []
+
     try:
-        resolved_base = skills_dir.resolve()
+        base_prefix = _resolved_base(str(skills_dir))
+        with os.scandir(skills_dir) as it:
+            for entry in it:
+                # 被排除的目录名直接跳过，不做任何解析
+                if exclude_names is not None and entry.name in exclude_names:
+                    continue
+
+                # 不跟随符号链接：既省 stat，也避免链接指向目录外
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+
+                # 安全检查
+                if not _is_safe_path(entry.path, base_prefix):
+                    continue
+
+                # 单次 stat 同时完成存在性检查，结果传给 load_skill 复用
+                skill_md = entry.path + _SKILL_MD_SUFFIX
+                try:
+                    md_st = os.stat(skill_md)
+                except OSError:
+                    continue
+                if not stat_module.S_ISREG(md_st.st_mode):
+                    continue
+
+                # 安全检查 SKILL.md 路径
+                if not _is_safe_path(skill_md, base_prefix):
+                    continue
+
+                candidates.append((Path(skill_md), md_st))
+    except FileNotFoundError:
+        return []
     except (OSError, RuntimeError):
         return []
-    
-    skills: list[Skill] = []
-    
-    for skill_dir in skills_dir.iterdir():
-        # 安全检查
-        if not _is_safe_path(skill_dir, resolved_base):
-            continue
-        
-        if not skill_dir.is_dir():
-            continue
-        
-        skill_md_path = skill_dir / "SKILL.md"
-        if not skill_md_path.exists():
-            continue
-        
-        # 安全检查 SKILL.md 路径
-        if not _is_safe_path(skill_md_path, resolved_base):
-            continue
-        
-        skill = load_skill(skill_md_path, source)
-        if skill:
-            skills.append(skill)
-    
-    return skills
+
+    # 读取和解析互相独立，文件 I/O 期间会释放 GIL，
+    # 候选较多时用线程池重叠磁盘等待；按名称排序保证结果确定
+    if len(candidates) <= 2 or max_workers == 1:
+        loaded = [load_skill(p, source, st) for p, st in candidates]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        if max_workers is None:
+            max_workers = min(32, len(candidates))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            loaded = list(pool.map(lambda c: load_skill(c[0], source, c[1]), candidates))
+
+    return sorted(
+        (skill for skill in loaded if skill is not None),
+        key=lambda s: s.name,
+    )
 
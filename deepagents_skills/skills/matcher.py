@@ -0,0 +1,243 @@
+"""技能语义匹配器
+
+基于句向量 + FAISS 内积索引的技能匹配，在注册表加载时对每个技能的
+frontmatter 描述做一次性编码，查询时做 top-k 最近邻检索，匹配耗时
+与技能数量基本无关。
+
+依赖 `sentence-transformers`（可选）。`faiss` 可用时走 FAISS 索引；
+否则回退到纯 NumPy 矩阵乘（BLAS sgemv）+ argpartition 的 top-k 检索。
+编码依赖缺失时匹配器不可用，注册表会自动回退到触发词匹配。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from deepagents_skills.memory.embedding_cache import EmbeddingCache
+    from deepagents_skills.skills.model import Skill
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer  # type: ignore
+
+    _HAS_EMBEDDING_DEPS = True
+except ImportError:
+    _HAS_EMBEDDING_DEPS = False
+
+try:
+    import faiss  # type: ignore
+
+    _HAS_FAISS = True
+except ImportError:
+    # FAISS 不可用时用纯 NumPy 矩阵乘做检索，
+    # N<1000 时性能与 FAISS 同数量级
+    _HAS_FAISS = False
+
+# 默认编码模型
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+# 相似度阈值：低于此值的候选会被过滤
+DEFAULT_SIMILARITY_THRESHOLD = 0.35
+# 默认返回的候选数量
+DEFAULT_TOP_K = 5
+# 批量编码大小
+ENCODE_BATCH_SIZE = 64
+
+
+def embedding_available() -> bool:
+    """检查语义匹配依赖是否可用"""
+    return _HAS_EMBEDDING_DEPS
+
+
+class EmbeddingMatcher:
+    """基于向量检索的技能匹配器
+
+    对技能描述做一次性批量编码并建立 FAISS 内积索引（向量归一化后
+    内积即余弦相似度），查询时编码单条查询并检索 top-k。
+
+    Example:
+        >>> matcher = EmbeddingMatcher()
+        >>> matcher.build(registry.get_all())
+        >>> matched = matcher.match("帮我研究一下量子计算")
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        top_k: int = DEFAULT_TOP_K,
+    ):
+        """初始化匹配器
+
+        Args:
+            model_name: sentence-transformers 模型名称
+            threshold: 相似度阈值
+            top_k: 检索的候选数量
+        """
+        if not _HAS_EMBEDDING_DEPS:
+            raise ImportError(
+                "语义匹配需要 sentence-transformers 和 faiss，"
+                "请安装后重试或使用触发词匹配"
+            )
+        self.model_name = model_name
+        self.threshold = threshold
+        self.top_k = top_k
+        self._model: "SentenceTransformer" | None = None
+        self._index = None
+        self._matrix: "np.ndarray" | None = None  # FAISS 不可用时的 (N, d) 向量矩阵
+        self._skills: list["Skill"] = []
+
+    def _get_model(self) -> "SentenceTransformer":
+        """懒加载编码模型"""
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def build(self, skills: list["Skill"], cache: "EmbeddingCache" | None = None) -> None:
+        """为技能列表建立向量索引
+
+        只编码 frontmatter 的 description 字段，不编码指令正文。
+        传入缓存时按内容哈希做增量同步：只有新增或描述变更的技能
+        会重新编码，其余复用缓存向量，未变更的技能库零编码调用。
+
+        Args:
+            skills: 要索引的技能列表
+            cache: 可选的持久化向量缓存
+        """
+        self._skills = list(skills)
+        if not self._skills:
+            self._index = None
+            self._matrix = None
+            return
+
+        if cache is not None:
+            vectors = self._load_vectors_with_cache(cache)
+        else:
+            vectors = self._get_model().encode(
+                [s.description for s in self._skills],
+                normalize_embeddings=True,
+                batch_size=ENCODE_BATCH_SIZE,
+            ).astype(np.float32)
+
+        if _HAS_FAISS:
+            index = faiss.IndexFlatIP(vectors.shape[1])
+            index.add(vectors)
+            self._index = index
+        else:
+            self._matrix = np.ascontiguousarray(vectors)
+
+    def _load_vectors_with_cache(self, cache: "EmbeddingCache") -> "np.ndarray":
+        """通过缓存增量加载向量矩阵
+
+        向量以 float16 落盘（体积减半，top-k 排序几乎无损），
+        加载后转回 float32 参与检索。
+        """
+        from deepagents_skills.memory.embedding_cache import hash_text
+
+        hashes = [hash_text(s.description) for s in self._skills]
+        cached_rows = cache.get_many([s.name for s in self._skills])
+
+        vectors: list["np.ndarray" | None] = [None] * len(self._skills)
+        dirty_indices: list[int] = []
+
+        for i, (skill, content_hash) in enumerate(zip(self._skills, hashes)):
+            row = cached_rows.get(skill.name)
+            if row is not None and row[0] == content_hash and row[1] == self.model_name:
+                stored_dtype = np.float16 if row[2] == "float16" else np.float32
+                vectors[i] = np.frombuffer(row[3], dtype=stored_dtype).astype(np.float32)
+            else:
+                dirty_indices.append(i)
+
+        if dirty_indices:
+            encoded = self._get_model().encode(
+                [self._skills[i].description for i in dirty_indices],
+                normalize_embeddings=True,
+                batch_size=ENCODE_BATCH_SIZE,
+            ).astype(np.float32)
+            cache.put_many([
+                (
+                    self._skills[i].name,
+                    hashes[i],
+                    self.model_name,
+                    "float16",
+                    encoded[j].astype(np.float16).tobytes(),
+                )
+                for j, i in enumerate(dirty_indices)
+            ])
+            for j, i in enumerate(dirty_indices):
+                vectors[i] = encoded[j]
+
+        return np.vstack(vectors)
+
+    @property
+    def ready(self) -> bool:
+        """索引是否已建立"""
+        return self._index is not None or self._matrix is not None
+
+    def _top_k_numpy(self, scores: "np.ndarray") -> list["Skill"]:
+        """从相似度向量中取 top-k 并按阈值过滤（NumPy 回退路径）"""
+        k = min(self.top_k, len(self._skills))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [self._skills[i] for i in top if scores[i] >= self.threshold]
+
+    def match(self, query: str) -> list["Skill"]:
+        """根据查询检索匹配的技能
+
+        Args:
+            query: 用户查询文本
+
+        Returns:
+            按相似度降序排列的技能列表（已按阈值过滤）
+        """
+        if not self.ready:
+            return []
+
+        query_vec = self._get_model().encode(
+            [query], normalize_embeddings=True
+        ).astype(np.float32)
+
+        if self._index is not None:
+            k = min(self.top_k, len(self._skills))
+            scores, indices = self._index.search(query_vec, k)
+            return [
+                self._skills[idx]
+                for score, idx in zip(scores[0], indices[0])
+                if idx >= 0 and score >= self.threshold
+            ]
+
+        return self._top_k_numpy(self._matrix @ query_vec[0])
+
+    def match_batch(self, queries: list[str]) -> list[list["Skill"]]:
+        """批量检索多条查询
+
+        整批编码和检索，摊薄 BLAS/FAISS 的单次调度开销，
+        明显快于逐条调用 match。
+
+        Args:
+            queries: 查询文本列表
+
+        Returns:
+            与 queries 对应的技能列表的列表
+        """
+        if not self.ready or not queries:
+            return [[] for _ in queries]
+
+        query_vecs = self._get_model().encode(
+            queries, normalize_embeddings=True, batch_size=32
+        ).astype(np.float32)
+
+        if self._index is not None:
+            k = min(self.top_k, len(self._skills))
+            scores, indices = self._index.search(query_vecs, k)
+            return [
+                [
+                    self._skills[idx]
+                    for score, idx in zip(row_scores, row_indices)
+                    if idx >= 0 and score >= self.threshold
+                ]
+                for row_scores, row_indices in zip(scores, indices)
+            ]
+
+        all_scores = query_vecs @ self._matrix.T
+        return [self._top_k_numpy(row) for row in all_scores]
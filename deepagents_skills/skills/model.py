@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -17,7 +18,7 @@ class SkillSource(Enum):
     PROJECT = "project" # 项目级技能 (.deepagents/skills/)
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMetadata:
     """技能元数据
     
@@ -35,21 +36,35 @@ class SkillMetadata:
     triggers: list[str] = field(default_factory=list)
     dependencies: list[str] = field(default_factory=list)
     priority: int = 0
-    
+    # 构造时预先小写化的触发词，matches 热路径直接复用
+    _triggers_lower: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._triggers_lower = tuple(t.lower() for t in self.triggers)
+
+    def __getitem__(self, key: str) -> Any:
+        """字典风格访问：meta["name"] 等价于 meta.name
+
+        兼容把元数据当字典用的调用方；键不存在时抛出 KeyError。
+        """
+        if key.startswith("_"):
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
     def matches(self, query: str) -> bool:
         """检查查询是否匹配此技能的触发词
-        
+
         Args:
             query: 用户查询文本
-            
+
         Returns:
             如果查询包含任何触发词则返回 True
         """
         query_lower = query.lower()
-        for trigger in self.triggers:
-            if trigger.lower() in query_lower:
-                return True
-        return False
+        return any(t in query_lower for t in self._triggers_lower)
     
     def to_dict(self) -> dict[str, Any]:
         """转换为字典"""
@@ -73,7 +88,7 @@ class SkillMetadata:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Skill:
     """完整技能类
     
@@ -81,32 +96,53 @@ class Skill:
     
     Attributes:
         metadata: 技能元数据
-        content: SKILL.md 的完整内容（包括 frontmatter 后的指令部分）
         instructions: 技能指令（不包括 frontmatter 的 Markdown 内容）
         path: SKILL.md 文件的路径
         source: 技能来源（用户级或项目级）
+        content: SKILL.md 的完整内容（惰性属性，首次访问时从文件读取）
         directory: 技能目录路径（包含 SKILL.md 和其他支持文件）
     """
     metadata: SkillMetadata
-    content: str
     instructions: str
     path: Path
     source: SkillSource
-    
+    # 完整文件内容的惰性缓存；None 表示尚未读取。
+    # instructions 已覆盖正文，常驻保存 content 会让每个技能
+    # 的大部分字节重复存一份
+    _content: str | None = field(default=None, repr=False, compare=False)
+    # 构造时算好的目录路径（Path.parent 每次访问都会新建 Path）
+    _directory: Path | None = field(init=False, repr=False, compare=False)
+    # 支持文件列表缓存：(目录 mtime_ns, 文件元组)
+    _files_cache: tuple[int, tuple[Path, ...]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._directory = self.path.parent if self.path is not None else None
+
+    @property
+    def content(self) -> str:
+        """SKILL.md 的完整内容（惰性读取并缓存）"""
+        if self._content is None:
+            if self.path is None:
+                return ""
+            self._content = self.path.read_text(encoding="utf-8")
+        return self._content
+
     @property
     def name(self) -> str:
         """技能名称"""
         return self.metadata.name
-    
+
     @property
     def description(self) -> str:
         """技能描述"""
         return self.metadata.description
-    
+
     @property
     def directory(self) -> Path:
         """技能目录路径"""
-        return self.path.parent
+        return self._directory
     
     @property
     def triggers(self) -> list[str]:
@@ -129,29 +165,51 @@ class Skill:
     
     def list_supporting_files(self) -> list[Path]:
         """列出技能目录中的支持文件（除 SKILL.md 外的文件）
-        
+
+        结果按目录 mtime 缓存；目录未变化时重复调用不再扫描。
+        用 os.scandir 复用目录项自带的类型信息。
+
         Returns:
             支持文件路径列表
         """
-        if not self.directory.exists():
+        try:
+            dir_mtime = os.stat(self._directory).st_mtime_ns
+        except OSError:
             return []
-        return [
-            f for f in self.directory.iterdir()
-            if f.is_file() and f.name != "SKILL.md"
-        ]
+
+        cached = self._files_cache
+        if cached is not None and cached[0] == dir_mtime:
+            return list(cached[1])
+
+        try:
+            with os.scandir(self._directory) as it:
+                files = tuple(
+                    Path(entry.path)
+                    for entry in it
+                    if entry.name != "SKILL.md" and entry.is_file()
+                )
+        except OSError:
+            return []
+        self._files_cache = (dir_mtime, files)
+        return list(files)
     
     def get_supporting_file(self, filename: str) -> Path | None:
         """获取支持文件的路径
-        
+
+        用 os.path 做拼接和单次 stat 检查，只在命中时才构造
+        Path 对象。
+
         Args:
             filename: 文件名
-            
+
         Returns:
             文件路径，如果不存在则返回 None
         """
-        file_path = self.directory / filename
-        if file_path.exists() and file_path.is_file():
-            return file_path
+        if self._directory is None:
+            return None
+        candidate = os.path.join(self._directory, filename)
+        if os.path.isfile(candidate):
+            return Path(candidate)
         return None
     
     def to_dict(self) -> dict[str, Any]:
@@ -5,14 +5,65 @@
 
 from __future__ import annotations
 
+import re
+import sys
 from typing import TYPE_CHECKING, Iterator
 
+from deepagents_skills.skills.matcher import EmbeddingMatcher, embedding_available
 from deepagents_skills.skills.model import Skill, SkillSource
 
 if TYPE_CHECKING:
     from deepagents_skills.config import Config
+    from deepagents_skills.memory.embedding_cache import EmbeddingCache
     from deepagents_skills.skills.discovery import SkillDiscovery
 
+try:
+    import ahocorasick  # type: ignore
+
+    _HAS_AHOCORASICK = True
+except ImportError:
+    # pyahocorasick 不可用时退回逐触发词的子串扫描
+    _HAS_AHOCORASICK = False
+
+try:
+    import numpy as _np  # type: ignore
+    from numba import njit  # type: ignore
+
+    @njit(cache=True)
+    def _scan_triggers(query, trig_bytes, offsets, out_mask):  # pragma: no cover
+        """在扁平 uint8 触发词缓冲上做一次批量子串扫描
+
+        对每个触发词在查询字节串里做朴素子串匹配，
+        命中时置位 out_mask 的对应下标。
+        """
+        nq = query.shape[0]
+        for t in range(offsets.shape[0] - 1):
+            start = offsets[t]
+            m = offsets[t + 1] - start
+            if m == 0 or m > nq:
+                continue
+            for i in range(nq - m + 1):
+                ok = True
+                for j in range(m):
+                    if query[i + j] != trig_bytes[start + j]:
+                        ok = False
+                        break
+                if ok:
+                    out_mask[t] = 1
+                    break
+
+    _HAS_NUMBA = True
+except ImportError:
+    # numba/numpy 不可用时走 Aho-Corasick 或逐触发词扫描
+    _HAS_NUMBA = False
+
+# 触发词数量达到该阈值才启用 numba 批量扫描（小索引不值得 JIT 预热）
+_NUMBA_MIN_TRIGGERS = 256
+
+# 单词级触发词的判定与查询分词（仅 ASCII 单词；
+# 中文触发词没有词边界，仍走子串匹配路径）
+_ASCII_WORD_RE = re.compile(r"[a-z0-9_]+")
+
 
 class SkillRegistry:
     """技能注册表
@@ -30,6 +81,36 @@ class SkillRegistry:
         """初始化注册表"""
         self._skills: dict[str, Skill] = {}
         self._trigger_index: dict[str, list[str]] = {}  # trigger -> [skill_names]
+        # ASCII 单词触发词的精确 token 索引（_trigger_index 的子集），
+        # 匹配时先按查询分词做 O(1) 查找，命中的触发词跳过子串扫描
+        self._token_index: dict[str, list[str]] = {}
+        self._embedding_matcher: EmbeddingMatcher | None = None
+        self._summary_cache: list[dict] | None = None  # list_summaries 的缓存
+        # 变更计数器：每次实际增删技能时递增，
+        # 供外部（如 SkillChain/SkillPipeline）校验其解析缓存是否过期
+        self._version = 0
+        # Aho-Corasick 自动机（可选依赖），触发词变更后懒重建
+        self._ac = None
+        self._ac_dirty = True
+        # numba 批量扫描用的扁平触发词缓冲（可选依赖），懒重建
+        self._nb_dirty = True
+        self._nb_trigger_names: list[list[str]] = []
+        self._nb_trig_bytes = None
+        self._nb_offsets = None
+        # 回退子串扫描用的 UTF-8 触发词对：(bytes 触发词, str 触发词, 技能名列表)
+        self._bytes_triggers: list[tuple[bytes, str, list[str]]] = []
+        self._bt_dirty = True
+        # 依赖解析顺序缓存：技能名 -> 拓扑序技能元组。
+        # 按版本号惰性失效，注册期间的批量变更不逐次清理
+        self._dep_order_cache: dict[str, tuple[Skill, ...]] = {}
+        self._dep_cache_version = -1
+        # get_all 的排序结果缓存，注册表变更时失效
+        self._sorted_cache: tuple[Skill, ...] | None = None
+
+    @property
+    def version(self) -> int:
+        """注册表的变更版本号"""
+        return self._version
     
     def register(self, skill: Skill) -> None:
         """注册技能
@@ -41,6 +122,10 @@ class SkillRegistry:
         Args:
             skill: 要注册的技能
         """
+        # 驻留技能名：名称在注册表、依赖解析和匹配集合里反复做
+        # 哈希和相等比较，驻留后比较退化为指针比较
+        skill.metadata.name = sys.intern(skill.metadata.name)
+
         existing = self._skills.get(skill.name)
         
         if existing:
@@ -63,18 +148,30 @@ class SkillRegistry:
         # 注册新技能
         self._skills[skill.name] = skill
         self._add_trigger_index(skill)
+        self._summary_cache = None
+        self._sorted_cache = None
+        self._version += 1
     
     def _add_trigger_index(self, skill: Skill) -> None:
         """添加触发词索引"""
+        self._ac_dirty = True
+        self._nb_dirty = True
+        self._bt_dirty = True
         for trigger in skill.triggers:
-            trigger_lower = trigger.lower()
+            trigger_lower = sys.intern(trigger.lower())
             if trigger_lower not in self._trigger_index:
                 self._trigger_index[trigger_lower] = []
             if skill.name not in self._trigger_index[trigger_lower]:
                 self._trigger_index[trigger_lower].append(skill.name)
+            # ASCII 单词触发词同时进 token 索引
+            if _ASCII_WORD_RE.fullmatch(trigger_lower):
+                self._token_index[trigger_lower] = self._trigger_index[trigger_lower]
     
     def _remove_trigger_index(self, skill: Skill) -> None:
         """移除触发词索引"""
+        self._ac_dirty = True
+        self._nb_dirty = True
+        self._bt_dirty = True
         for trigger in skill.triggers:
             trigger_lower = trigger.lower()
             if trigger_lower in self._trigger_index:
@@ -82,6 +179,7 @@ class SkillRegistry:
                     self._trigger_index[trigger_lower].remove(skill.name)
                 if not self._trigger_index[trigger_lower]:
                     del self._trigger_index[trigger_lower]
+                    self._token_index.pop(trigger_lower, None)
     
     def unregister(self, name: str) -> Skill | None:
         """取消注册技能
@@ -95,49 +193,200 @@ class SkillRegistry:
         skill = self._skills.pop(name, None)
         if skill:
             self._remove_trigger_index(skill)
+            self._summary_cache = None
+            self._sorted_cache = None
+            self._version += 1
         return skill
     
     def get(self, name: str) -> Skill | None:
         """按名称获取技能
-        
+
         Args:
             name: 技能名称
-            
+
         Returns:
             技能实例，不存在则返回 None
         """
-        return self._skills.get(name)
+        try:
+            return self._skills[name]
+        except KeyError:
+            return None
+
+    def __getitem__(self, name: str) -> Skill:
+        """按名称获取技能，不存在时抛出 KeyError
+
+        热路径上配合 try/except 使用，单次哈希查找即可
+        同时完成存在性检查和取值。
+        """
+        return self._skills[name]
     
     def get_all(self) -> list[Skill]:
         """获取所有技能
-        
+
+        排序结果会被缓存，注册表不变时重复调用为 O(N) 拷贝
+        而非 O(N log N) 重排。
+
         Returns:
             技能列表，按优先级降序排序
         """
-        return sorted(
-            self._skills.values(),
-            key=lambda s: (-s.priority, s.name)
-        )
+        if self._sorted_cache is None:
+            self._sorted_cache = tuple(sorted(
+                self._skills.values(),
+                key=lambda s: (-s.priority, s.name)
+            ))
+        return list(self._sorted_cache)
     
     def match(self, query: str) -> list[Skill]:
         """根据查询匹配技能
-        
-        使用触发词进行匹配，返回按优先级排序的结果。
-        
+
+        优先使用语义向量索引匹配（见 rebuild_embeddings）；
+        索引不可用时回退到触发词匹配。
+
         Args:
             query: 用户查询文本
-            
+
+        Returns:
+            匹配的技能列表
+        """
+        if self._embedding_matcher is not None and self._embedding_matcher.ready:
+            return self._embedding_matcher.match(query)
+        return self._match_by_trigger_index(query)
+
+    def match_batch(self, queries: list[str]) -> list[list[Skill]]:
+        """批量匹配多条查询
+
+        语义索引可用时整批编码和检索；否则逐条触发词匹配。
+
+        Args:
+            queries: 查询文本列表
+
+        Returns:
+            与 queries 对应的技能列表的列表
+        """
+        if self._embedding_matcher is not None and self._embedding_matcher.ready:
+            return self._embedding_matcher.match_batch(queries)
+        return [self._match_by_trigger_index(q) for q in queries]
+
+    def _get_automaton(self):
+        """获取触发词的 Aho-Corasick 自动机（懒重建）
+
+        所有触发词编译进同一个自动机后，一次线性扫描即可找出
+        查询中出现的全部触发词，替代逐触发词的子串检查。
+        """
+        if self._ac_dirty:
+            if self._trigger_index:
+                automaton = ahocorasick.Automaton()
+                for trigger, skill_names in self._trigger_index.items():
+                    automaton.add_word(trigger, skill_names)
+                automaton.make_automaton()
+                self._ac = automaton
+            else:
+                self._ac = None
+            self._ac_dirty = False
+        return self._ac
+
+    def _build_trigger_buffers(self) -> None:
+        """把触发词索引编码为扁平 uint8 缓冲 + 偏移数组（numba 路径）"""
+        items = list(self._trigger_index.items())
+        self._nb_trigger_names = [names for _, names in items]
+
+        offsets = _np.zeros(len(items) + 1, dtype=_np.int32)
+        chunks: list[bytes] = []
+        total = 0
+        for i, (trigger, _) in enumerate(items):
+            encoded = trigger.encode("utf-8")
+            chunks.append(encoded)
+            total += len(encoded)
+            offsets[i + 1] = total
+
+        if total:
+            self._nb_trig_bytes = _np.frombuffer(b"".join(chunks), dtype=_np.uint8)
+        else:
+            self._nb_trig_bytes = _np.zeros(0, dtype=_np.uint8)
+        self._nb_offsets = offsets
+        self._nb_dirty = False
+
+    def match_top1(self, query: str) -> Skill | None:
+        """返回匹配度最高的单个技能
+
+        auto_execute 默认只执行 top-1 技能；此路径用一次线性
+        argmax 代替完整排序，不构建结果列表。
+
+        Args:
+            query: 用户查询文本
+
         Returns:
-            匹配的技能列表，按优先级降序排序
+            优先级最高的匹配技能，无匹配时返回 None
         """
+        if self._embedding_matcher is not None and self._embedding_matcher.ready:
+            matched = self._embedding_matcher.match(query)
+            return matched[0] if matched else None
+
+        best: Skill | None = None
+        for name in self._matched_names(query.lower()):
+            skill = self._skills.get(name)
+            if skill is None:
+                continue
+            if (
+                best is None
+                or skill.priority > best.priority
+                or (skill.priority == best.priority and skill.name < best.name)
+            ):
+                best = skill
+        return best
+
+    def _matched_names(self, query_lower: str) -> set[str]:
+        """收集触发词命中的技能名集合（未排序）"""
         matched_names: set[str] = set()
-        query_lower = query.lower()
-        
-        # 检查每个触发词
-        for trigger, skill_names in self._trigger_index.items():
-            if trigger in query_lower:
-                matched_names.update(skill_names)
-        
+
+        if _HAS_NUMBA and len(self._trigger_index) >= _NUMBA_MIN_TRIGGERS:
+            # 大索引：一次 JIT 批量扫描得到所有命中触发词的位图
+            if self._nb_dirty:
+                self._build_trigger_buffers()
+            query_bytes = _np.frombuffer(
+                query_lower.encode("utf-8"), dtype=_np.uint8
+            )
+            mask = _np.zeros(len(self._nb_trigger_names), dtype=_np.uint8)
+            _scan_triggers(query_bytes, self._nb_trig_bytes, self._nb_offsets, mask)
+            for idx in _np.nonzero(mask)[0]:
+                matched_names.update(self._nb_trigger_names[idx])
+        elif _HAS_AHOCORASICK:
+            automaton = self._get_automaton()
+            if automaton is not None:
+                for _, skill_names in automaton.iter(query_lower):
+                    matched_names.update(skill_names)
+        else:
+            # 先对 ASCII 单词触发词做精确 token 匹配（哈希查找），
+            # 命中的触发词不再参与子串扫描；未命中的仍然子串扫描，
+            # 保留触发词出现在更长单词内的匹配语义
+            satisfied: set[str] = set()
+            if self._token_index:
+                for token in _ASCII_WORD_RE.findall(query_lower):
+                    skill_names = self._token_index.get(token)
+                    if skill_names is not None:
+                        matched_names.update(skill_names)
+                        satisfied.add(token)
+
+            # 检查每个触发词；子串搜索在 UTF-8 字节串上进行
+            # （UTF-8 自同步，字节级子串与字符级子串等价），
+            # 避免 str in str 的宽度分派且触发词表更省内存
+            if self._bt_dirty:
+                self._bytes_triggers = [
+                    (trigger.encode("utf-8"), trigger, skill_names)
+                    for trigger, skill_names in self._trigger_index.items()
+                ]
+                self._bt_dirty = False
+            query_bytes = query_lower.encode("utf-8")
+            for trigger_bytes, trigger, skill_names in self._bytes_triggers:
+                if trigger not in satisfied and trigger_bytes in query_bytes:
+                    matched_names.update(skill_names)
+
+        return matched_names
+
+    def _match_by_trigger_index(self, query: str) -> list[Skill]:
+        """触发词匹配回退路径，按优先级降序排序"""
+        matched_names = self._matched_names(query.lower())
+
         # 获取技能并排序
         matched_skills = [
             self._skills[name]
@@ -177,6 +426,58 @@ class SkillRegistry:
             key=lambda s: (-s.priority, s.name)
         )
     
+    def dependency_order(self, name: str) -> tuple[Skill, ...]:
+        """计算技能的依赖执行顺序（依赖在前，自身在后）
+
+        用显式栈做迭代深度优先后序遍历，避免 Python 递归开销；
+        灰色集合（in_progress）用于跳过循环依赖。结果按技能名
+        缓存，注册表版本变更时惰性整体失效。
+
+        Args:
+            name: 技能名称
+
+        Returns:
+            按依赖顺序排列的技能元组；技能不存在时为空元组
+        """
+        if self._dep_cache_version != self._version:
+            self._dep_order_cache.clear()
+            self._dep_cache_version = self._version
+        cached = self._dep_order_cache.get(name)
+        if cached is not None:
+            return cached
+
+        root = self._skills.get(name)
+        if root is None:
+            self._dep_order_cache[name] = ()
+            return ()
+
+        order: list[Skill] = []
+        visited: set[str] = set()
+        in_progress: set[str] = {root.name}
+        stack: list[tuple[Skill, Iterator[str]]] = [(root, iter(root.dependencies))]
+
+        while stack:
+            skill, deps = stack[-1]
+            for dep_name in deps:
+                # 已处理或处于当前路径上（循环依赖）的直接跳过
+                if dep_name in visited or dep_name in in_progress:
+                    continue
+                dep = self._skills.get(dep_name)
+                if dep is None:
+                    continue
+                in_progress.add(dep_name)
+                stack.append((dep, iter(dep.dependencies)))
+                break
+            else:
+                stack.pop()
+                in_progress.discard(skill.name)
+                visited.add(skill.name)
+                order.append(skill)
+
+        result = tuple(order)
+        self._dep_order_cache[name] = result
+        return result
+
     def filter_by_source(self, source: SkillSource) -> list[Skill]:
         """按来源筛选技能
         
@@ -191,10 +492,39 @@ class SkillRegistry:
             if skill.source == source
         ]
     
+    def list_summaries(self) -> list[dict]:
+        """列出所有技能的摘要信息
+
+        结果会被缓存，注册表变更时自动失效。聊天会话中
+        list_skills 可能每轮被调用多次，命中时为零构建成本。
+
+        Returns:
+            技能摘要列表（按优先级降序）
+        """
+        if self._summary_cache is None:
+            self._summary_cache = [
+                {
+                    "name": skill.name,
+                    "description": skill.description,
+                    "triggers": skill.triggers,
+                    "source": skill.source.value,
+                    "priority": skill.priority,
+                }
+                for skill in self.get_all()
+            ]
+        return self._summary_cache
+
     def clear(self) -> None:
         """清空注册表"""
         self._skills.clear()
         self._trigger_index.clear()
+        self._token_index.clear()
+        self._ac_dirty = True
+        self._nb_dirty = True
+        self._bt_dirty = True
+        self._summary_cache = None
+        self._sorted_cache = None
+        self._version += 1
     
     def load_from_discovery(self, discovery: "SkillDiscovery") -> int:
         """从发现服务加载技能
@@ -208,19 +538,68 @@ class SkillRegistry:
         skills = discovery.discover_all()
         for skill in skills:
             self.register(skill)
+        self.rebuild_embeddings(cache=self._default_embedding_cache(discovery))
         return len(skills)
+
+    async def aload_from_discovery(self, discovery: "SkillDiscovery") -> int:
+        """异步从发现服务加载技能
+
+        目录扫描并发执行，加载语义与 load_from_discovery 一致。
+
+        Args:
+            discovery: 技能发现服务
+
+        Returns:
+            加载的技能数量
+        """
+        skills = await discovery.adiscover_all()
+        for skill in skills:
+            self.register(skill)
+        self.rebuild_embeddings(cache=self._default_embedding_cache(discovery))
+        return len(skills)
+
+    @staticmethod
+    def _default_embedding_cache(discovery: "SkillDiscovery") -> "EmbeddingCache" | None:
+        """根据配置构建默认的向量缓存（依赖缺失时返回 None）"""
+        if not embedding_available():
+            return None
+        from deepagents_skills.memory.embedding_cache import EmbeddingCache
+
+        return EmbeddingCache(discovery.config.memory.user_dir / "skill_embeddings.db")
+
+    def rebuild_embeddings(self, cache: "EmbeddingCache" | None = None) -> bool:
+        """重建语义向量索引
+
+        对所有已注册技能的描述做批量编码并建立 FAISS 索引。
+        传入缓存时只重新编码新增或描述变更的技能。
+        依赖缺失时为空操作，match 会回退到触发词匹配。
+
+        Args:
+            cache: 可选的持久化向量缓存
+
+        Returns:
+            索引是否已建立
+        """
+        if not embedding_available():
+            return False
+        if self._embedding_matcher is None:
+            self._embedding_matcher = EmbeddingMatcher()
+        self._embedding_matcher.build(self.get_all(), cache=cache)
+        return self._embedding_matcher.ready
     
     def refresh(self, discovery: "SkillDiscovery") -> int:
         """刷新注册表
-        
-        清空现有技能并重新加载。
-        
+
+        先让发现服务的扫描缓存失效再清空重载，保证显式刷新
+        总是命中磁盘上的最新内容。
+
         Args:
             discovery: 技能发现服务
-            
+
         Returns:
             加载的技能数量
         """
+        discovery.invalidate()
         self.clear()
         return self.load_from_discovery(discovery)
     